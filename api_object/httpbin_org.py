@@ -2,9 +2,10 @@ from library.api_utils import APIUtils
 from library.allure import allure_attach_log
 
 class HttpbinOrg(APIUtils):
-    def __init__(self, session):
+    base_url = "https://httpbin.org"
+
+    def __init__(self, session=None):
         super().__init__(session)
-        self.base_url = "https://httpbin.org"
 
     @allure_attach_log(log_name="[Post] POST API (httpbin.org)")
     def post(self, **kwargs):
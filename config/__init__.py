@@ -1,3 +1,3 @@
-from .browser_config import get_chrome_options
+from .browser_config import get_chrome_options, BROWSER_PROFILES
 
-__all__ = ['get_chrome_options']
+__all__ = ['get_chrome_options', 'BROWSER_PROFILES']
@@ -1,10 +1,17 @@
 from selenium import webdriver
 
-def get_chrome_options(device: str = "desktop") -> webdriver.ChromeOptions:
+BROWSER_PROFILES = ["default", "performance"]
+
+def get_chrome_options(device: str = "desktop", profile: str = "default", user_data_dir: str = None,
+                       network_logging: bool = False) -> webdriver.ChromeOptions:
+    if profile not in BROWSER_PROFILES:
+        raise ValueError(f"Invalid browser profile: {profile}. Valid profiles: {', '.join(BROWSER_PROFILES)}")
+
     options = webdriver.ChromeOptions()
 
     # Common arguments
-    options.add_argument('--start-maximized')
+    if profile == "default":
+        options.add_argument('--start-maximized')
     options.add_argument('--autoplay-policy=no-user-gesture-required')
     options.add_argument('--disable-blink-features=AutomationControlled')
     options.add_argument('--disable-web-security')
@@ -21,6 +28,33 @@ def get_chrome_options(device: str = "desktop") -> webdriver.ChromeOptions:
         user_agent = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.7444.176 Safari/537.36'
         options.add_argument(f'user-agent={user_agent}')
 
+        if profile == "performance":
+            options.add_argument('--window-size=1920,1080')  # Headless has no screen to maximize to
+
+    if profile == "performance":
+        # Headless, low-resource browser for running many parallel workers
+        options.add_argument('--headless=new')
+        options.add_argument('--disable-gpu')
+        options.add_argument('--disable-extensions')
+        options.add_argument('--disable-component-extensions-with-background-pages')
+        options.add_argument('--disable-default-apps')
+        options.add_argument('--no-first-run')
+        options.add_argument('--mute-audio')
+
+        # Keep background tabs running at full speed, tests may wait on them
+        options.add_argument('--disable-background-timer-throttling')
+        options.add_argument('--disable-backgrounding-occluded-windows')
+        options.add_argument('--disable-renderer-backgrounding')
+        options.add_argument('--disable-background-networking')
+
+        # Smaller caches
+        options.add_argument('--disk-cache-size=33554432')   # 32 MB
+        options.add_argument('--media-cache-size=16777216')  # 16 MB
+        options.add_argument('--aggressive-cache-discard')
+
+    if user_data_dir:
+        options.add_argument(f'--user-data-dir={user_data_dir}')
+
     # Experimental options
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option('useAutomationExtension', False)
@@ -37,4 +71,9 @@ def get_chrome_options(device: str = "desktop") -> webdriver.ChromeOptions:
     }
     options.add_experimental_option('prefs', prefs)
 
+    # Network events in the 'performance' log, used by NetworkFilter stats
+    if network_logging:
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
+
     return options
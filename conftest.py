@@ -1,15 +1,28 @@
-import pytest, allure, base64
+import pytest, pytest_asyncio, allure, asyncio, base64, json, os, shutil, tempfile
 from dotenv import load_dotenv
+from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from library.page_utils import PageUtils
 from library.file_handler import FileHandler
-from config.browser_config import get_chrome_options
+from library.driver_pool import DriverPool
+from library.async_page_utils import AsyncBrowserSession
+from library.http_session_pool import HttpSessionPool
+from library.cassette import Cassette
+from library.driver_resolver import ChromeDriverResolver
+from library.exception import DriverResolverException
+from library.network_filter import NetworkFilter
+from library.poll_scheduler import PollStatsRecorder
+from library.command_timer import CommandTimer
+from library.tracing import Tracer
+from config.browser_config import get_chrome_options, BROWSER_PROFILES
 
 # Load environment variables from .env file
 load_dotenv()
 
+command_timings_key = pytest.StashKey[dict]()
+chromedriver_path_key = pytest.StashKey[str]()
+
 def pytest_addoption(parser):
     parser.addoption(
         "--device-type",
@@ -18,6 +31,19 @@ def pytest_addoption(parser):
         choices=["mobile", "desktop"],
         help="Device type for browser emulation: mobile or desktop (default: mobile)"
     )
+    parser.addoption(
+        "--browser-profile",
+        action="store",
+        default="default",
+        choices=BROWSER_PROFILES,
+        help="Browser profile: default (headed) or performance (headless, low-resource) (default: default)"
+    )
+    parser.addoption(
+        "--tmpfs-user-data-dir",
+        action="store_true",
+        default=False,
+        help="Put each browser's user-data-dir on tmpfs (/dev/shm when available)"
+    )
     parser.addoption(
         "--page-load-timeout",
         action="store",
@@ -25,56 +51,266 @@ def pytest_addoption(parser):
         default=60,
         help="Page load timeout in seconds (default: 60)"
     )
+    parser.addoption(
+        "--driver-pool-size",
+        action="store",
+        type=int,
+        default=1,
+        help="Max number of warm browsers kept per session / xdist worker (default: 1)"
+    )
+    parser.addoption(
+        "--block-resources",
+        action="store",
+        default="",
+        help=f"Comma-separated resource types to block via CDP: {', '.join(NetworkFilter.RESOURCE_TYPE_PATTERNS)} (default: none)"
+    )
+    parser.addoption(
+        "--block-url-pattern",
+        action="append",
+        default=[],
+        help="URL pattern to block via CDP, e.g. '*.mp4' (repeatable)"
+    )
+    parser.addoption(
+        "--perf-report-dir",
+        action="store",
+        default="perf-results",
+        help="Directory for performance reports such as wait poll stats (default: perf-results)"
+    )
+    parser.addoption(
+        "--trace-actions",
+        action="store_true",
+        default=False,
+        help="Record page-object / PageUtils / WebDriver spans as Chrome trace-event JSON in --perf-report-dir"
+    )
+    parser.addoption(
+        "--api-mode",
+        action="store",
+        default="live",
+        choices=Cassette.MODES,
+        help="API traffic: live, record to cassettes next to case_data, or replay from them (default: live)"
+    )
+
+def pytest_configure(config):
+    # Fail at startup on a bad --block-resources value instead of in the setup of every UI test
+    try:
+        NetworkFilter.patterns_for(_parse_block_resources(config))
+    except ValueError as e:
+        raise pytest.UsageError(f"--block-resources: {e}")
+
+    config.stash[command_timings_key] = {}
+    config.addinivalue_line(
+        "markers",
+        "block_resources(types=None, patterns=None): override --block-resources / --block-url-pattern for a test, "
+        "block_resources(types=[], patterns=[]) disables blocking"
+    )
+    config.addinivalue_line(
+        "markers",
+        "async_sessions(count): number of browser sessions the async_browsers fixture opens (default: 2)"
+    )
+
+def pytest_sessionfinish(session):
+    # One report per xdist worker, the controller has nothing to report
+    worker_id = os.getenv("PYTEST_XDIST_WORKER", "main")
+    report_dir = session.config.getoption("--perf-report-dir")
+
+    if PollStatsRecorder().stats:
+        PollStatsRecorder().export_json(os.path.join(report_dir, f"poll_stats_{worker_id}.json"))
+
+    command_timings = session.config.stash.get(command_timings_key, None)
+    if command_timings:
+        CommandTimer.export_json(command_timings, os.path.join(report_dir, f"command_timings_{worker_id}.json"))
+
+    if Tracer().session_events:
+        Tracer().export_json(Tracer().session_events, os.path.join(report_dir, "traces", f"session_{worker_id}.json"))
+
+def _parse_block_resources(config) -> list:
+    return [t.strip() for t in config.getoption("--block-resources").split(",") if t.strip()]
+
+def _get_block_config(request) -> tuple:
+    resource_types = _parse_block_resources(request.config)
+    url_patterns = request.config.getoption("--block-url-pattern")
+
+    marker = request.node.get_closest_marker("block_resources")
+    if marker:
+        resource_types = marker.kwargs.get("types", resource_types)
+        url_patterns = marker.kwargs.get("patterns", url_patterns)
+    return resource_types or [], url_patterns or []
+
+def _get_async_session_count(node) -> int:
+    marker = node.get_closest_marker("async_sessions")
+    return marker.args[0] if marker and marker.args else 2
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    # xdist controller: resolve chromedriver once per session (downloading on a cold cache)
+    # and hand the same path to every worker
+    stash = node.config.stash
+    if chromedriver_path_key not in stash:
+        try:
+            stash[chromedriver_path_key] = ChromeDriverResolver().resolve()
+        except DriverResolverException as e:
+            # Workers retry on their own and report the error from the tests that need a browser
+            print(f"Resolve chromedriver in controller failed: {e}")
+            stash[chromedriver_path_key] = None
+    node.workerinput["chromedriver_path"] = stash[chromedriver_path_key]
+
+@pytest.fixture(autouse=True)
+def trace_test(request):
+    if not request.config.getoption("--trace-actions"):
+        yield
+        return
+
+    # Function fixtures set up after this one (e.g. driver) are included in the timeline
+    tracer = Tracer()
+    tracer.start_test()
+    with tracer.span(request.node.nodeid, "test"):
+        yield
+
+    worker_id = os.getenv("PYTEST_XDIST_WORKER", "main")
+    file_name = f"{FileHandler.safe_file_name(request.node.nodeid)}_{worker_id}.json"
+    tracer.export_json(tracer.stop_test(), os.path.join(request.config.getoption("--perf-report-dir"), "traces", file_name))
+
+@pytest.fixture(autouse=True)
+def api_cassette(request):
+    api_mode = request.config.getoption("--api-mode")
+    if api_mode == "live":
+        yield None
+        return
+
+    # One cassette per test (and parametrized case), e.g. test_api/httpbin/cassettes/test_verify_success_1.json
+    cassette_path = Path(request.node.path).parent / "cassettes" / f"{FileHandler.safe_file_name(request.node.name)}.json"
+    cassette = Cassette(str(cassette_path), mode=api_mode)
+    http_session_pool = HttpSessionPool()
+    http_session_pool.use_cassette(cassette)
+    yield cassette
+
+    http_session_pool.use_cassette(None)
+    if api_mode == "record":
+        cassette.save()
 
 def load_test_data(file_path):
     return FileHandler().read_json_file(file_path)
 
-@pytest.fixture(scope="function")
-def driver(request):
+@pytest.fixture(scope="session")
+def chromedriver_path(request):
+    worker_input = getattr(request.config, "workerinput", {})
+    return worker_input.get("chromedriver_path") or ChromeDriverResolver().resolve()
+
+@pytest.fixture(scope="session")
+def driver_pool(request, chromedriver_path):
     device = request.config.getoption("--device-type")
+    profile = request.config.getoption("--browser-profile")
+
+    # Performance logging is only needed when some test blocks resources
+    network_logging = bool(
+        request.config.getoption("--block-resources") or request.config.getoption("--block-url-pattern")
+        or any(item.get_closest_marker("block_resources") for item in request.session.items)
+    )
+
+    user_data_root = None
+    if request.config.getoption("--tmpfs-user-data-dir"):
+        shm_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        user_data_root = tempfile.mkdtemp(prefix="chrome-profiles-", dir=shm_dir)
+
+    def create_driver():
+        user_data_dir = tempfile.mkdtemp(dir=user_data_root) if user_data_root else None
+        chrome_options = get_chrome_options(
+            device=device, profile=profile, user_data_dir=user_data_dir, network_logging=network_logging
+        )
+        service = Service(chromedriver_path)
+        return webdriver.Chrome(service=service, options=chrome_options)
+
+    # Async tests hold several sessions at once, keep enough warm browsers for the largest one
+    async_sessions = [
+        _get_async_session_count(item) for item in request.session.items
+        if "async_browsers" in getattr(item, "fixturenames", [])
+    ]
+    pool_size = max([request.config.getoption("--driver-pool-size")] + async_sessions)
+
+    pool = DriverPool(create_driver, size=pool_size)
+    yield pool
+    pool.close()
+
+    if user_data_root:
+        shutil.rmtree(user_data_root, ignore_errors=True)
 
+@pytest.fixture(scope="function")
+def driver(request, driver_pool):
     if not hasattr(request.node, 'screenshot_path_list'):
         request.node.screenshot_path_list = []
 
     file_handler = FileHandler()
 
-    # Setup Chrome driver with options
-    chrome_options = get_chrome_options(device=device)
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
+    # Check out a warm browser from the session pool
+    driver = driver_pool.acquire()
 
-    # Set page load timeout from pytest options
-    driver.set_page_load_timeout(request.config.getoption("--page-load-timeout"))
+    # Whatever fails from here on, the browser must go back to the pool (or be discarded)
+    network_filter = None
+    try:
+        # Time every WebDriver command of this test
+        command_timer = CommandTimer.attach(driver)
+        command_timer.reset()
 
-    page_utils = PageUtils(driver)
-    yield driver
+        # Set page load timeout from pytest options
+        driver.set_page_load_timeout(request.config.getoption("--page-load-timeout"))
 
-    # Screenshot capture
-    with allure.step("Capture browser screenshots"):
-        try:
-            window_handles = driver.window_handles
-            with allure.step(f"Found {len(window_handles)} window(s)"):
-                for i, handle in enumerate(window_handles):
-                    try:
-                        with allure.step(f"Capture screenshot for window #{i + 1}"):
-                            screenshot_path = f"allure-results/{request.node.name}_{i}.png"
-
-                            # Switch to window by handle (not index) to avoid stale references
-                            driver.switch_to.window(handle)
-
-                            # Verify window is still valid before screenshot
-                            if driver.current_url:
-                                page_utils.page_screenshot(
-                                    save_path=screenshot_path,
-                                    full_page=True
-                                )
-                                request.node.screenshot_path_list.append(screenshot_path)
-                    except Exception as e:
-                        print(f"Failed to capture screenshot for window #{i + 1}: {e}")
-        except Exception as e:
-            print(f"Failed to get window handles: {e}")
-
-    driver.quit()
+        # Block resources the test never asserts on (images, fonts, ads, telemetry)
+        resource_types, url_patterns = _get_block_config(request)
+        network_filter = NetworkFilter(driver)
+        if resource_types or url_patterns:
+            network_filter.block(resource_types, url_patterns)
+
+        page_utils = PageUtils(driver)
+        yield driver
+
+        if network_filter.blocked_patterns:
+            with allure.step("Collect network filter stats"):
+                try:
+                    allure.attach(
+                        json.dumps(network_filter.collect_stats(), indent=4),
+                        name="Network filter stats",
+                        attachment_type=allure.attachment_type.JSON
+                    )
+                except Exception as e:
+                    print(f"Failed to collect network filter stats: {e}")
+
+        # Screenshot capture
+        with allure.step("Capture browser screenshots"):
+            try:
+                window_handles = driver.window_handles
+                with allure.step(f"Found {len(window_handles)} window(s)"):
+                    for i, handle in enumerate(window_handles):
+                        try:
+                            with allure.step(f"Capture screenshot for window #{i + 1}"):
+                                screenshot_path = f"allure-results/{request.node.name}_{i}.png"
+
+                                # Switch to window by handle (not index) to avoid stale references
+                                driver.switch_to.window(handle)
+
+                                # Verify window is still valid before screenshot
+                                if driver.current_url:
+                                    page_utils.page_screenshot(
+                                        save_path=screenshot_path,
+                                        full_page=True
+                                    )
+                                    request.node.screenshot_path_list.append(screenshot_path)
+                        except Exception as e:
+                            print(f"Failed to capture screenshot for window #{i + 1}: {e}")
+            except Exception as e:
+                print(f"Failed to get window handles: {e}")
+
+        request.config.stash[command_timings_key][request.node.nodeid] = command_timer.snapshot()
+
+    finally:
+        # Blocked URLs stay on the browser, later tests on this pooled driver must not inherit them
+        if network_filter is not None and network_filter.blocked_patterns:
+            try:
+                network_filter.clear()
+            except Exception as e:
+                print(f"Failed to clear network filter: {e}")
+
+        # Reset browser state and return it to the pool, crashed or hung drivers are discarded
+        driver_pool.release(driver)
 
     # Write screenshot information to Allure report
     if request.node.screenshot_path_list:
@@ -89,3 +325,43 @@ def driver(request):
                     onclick="window.open(this.src, '_blank');">"""
             description += """</body>"""
             allure.dynamic.description_html(description)
+
+@pytest.fixture(scope="session")
+def http_session_pool():
+    # Kept-alive HTTP sessions shared by all API tests of this session / xdist worker
+    pool = HttpSessionPool()
+    yield pool
+    pool.close()
+
+@pytest.fixture(autouse=True)
+def isolate_http_sessions():
+    yield
+    # Pooled sessions outlive the test, cookies it collected must not reach the next one
+    HttpSessionPool().clear_cookies()
+
+@pytest_asyncio.fixture
+async def async_browsers(request, driver_pool):
+    count = _get_async_session_count(request.node)
+    page_load_timeout = request.config.getoption("--page-load-timeout")
+
+    # Starting a browser blocks for seconds, so check the sessions out of the pool in parallel
+    drivers = await asyncio.gather(*(asyncio.to_thread(driver_pool.acquire) for _ in range(count)), return_exceptions=True)
+    errors = [driver for driver in drivers if isinstance(driver, Exception)]
+    if errors:
+        for driver in drivers:
+            if not isinstance(driver, Exception):
+                driver_pool.release(driver)
+        raise errors[0]
+
+    sessions = []
+    try:
+        for index, driver in enumerate(drivers):
+            driver.set_page_load_timeout(page_load_timeout)
+            sessions.append(AsyncBrowserSession(driver, name=str(index)))
+
+        yield sessions
+
+    finally:
+        for session in sessions:
+            session.close()
+        await asyncio.gather(*(asyncio.to_thread(driver_pool.release, driver) for driver in drivers))
@@ -3,6 +3,7 @@ import allure
 import uuid
 from functools import wraps
 from library.logger import HandleLog
+from library.tracing import Tracer
 
 def conditional_allure_attach_log(condition=True, log_name=None):
     def decorator(func):
@@ -20,7 +21,7 @@ def conditional_allure_attach_log(condition=True, log_name=None):
                 log.add_file_handler(log_filename)
 
                 step_name = log_name or original_func.__name__
-                with allure.step(f"{step_name}"):
+                with allure.step(f"{step_name}"), Tracer().span(step_name, "page_object"):
                     log.info_log(f"----- {step_name} -----")
                     return original_func(*args, **kwargs)
 
@@ -0,0 +1,62 @@
+import json
+from time import perf_counter
+import requests
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class APIResponse:
+    # Wraps requests.Response and decodes the JSON body at most once, on first use;
+    # everything else (status_code, text, headers, ...) is read from the wrapped response
+    _NOT_DECODED = object()
+
+    def __init__(self, response: requests.Response):
+        self._response = response
+        self._data = self._NOT_DECODED
+        self._decode_error = None
+        self.decode_time = None
+
+    def __getattr__(self, name):
+        return getattr(self._response, name)
+
+    def __bool__(self):
+        # Same as requests: truthy only for a successful status
+        return bool(self._response)
+
+    @property
+    def raw_response(self) -> requests.Response:
+        return self._response
+
+    @property
+    def is_decoded(self) -> bool:
+        return self.decode_time is not None
+
+    def json(self):
+        if self._data is self._NOT_DECODED and self._decode_error is None:
+            start_time = perf_counter()
+            try:
+                self._data = self._decode()
+            except ValueError as e:
+                # Raise what requests raises, a JSONDecodeError that is also a RequestException
+                self._decode_error = requests.exceptions.JSONDecodeError(
+                    getattr(e, "msg", str(e)), getattr(e, "doc", ""), getattr(e, "pos", 0), response=self._response
+                )
+            finally:
+                self.decode_time = perf_counter() - start_time
+
+        if self._decode_error is not None:
+            raise self._decode_error
+        return self._data
+
+    def _decode(self):
+        # orjson only reads UTF-8 bytes, other charsets go through the text decoded by requests
+        encoding = (self._response.encoding or "utf-8").lower().replace("-", "")
+        if orjson is not None and encoding == "utf8":
+            return orjson.loads(self._response.content)
+        return json.loads(self._response.text)
+
+    def __repr__(self):
+        return f"<APIResponse [{self._response.status_code}]>"
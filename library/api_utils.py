@@ -1,12 +1,21 @@
-import requests, json
+import requests, json, os
 from library.exception import *
-from library.logger import HandleLog
+from library.logger import HandleLog, LazyLogValue
+from library.api_response import APIResponse
+from library.http_session_pool import HttpSessionPool
 
 class APIUtils():
-    def __init__(self, session):
+    base_url = None
+    # Logged bodies longer than this are truncated (0 disables the cap), compact logs one line per body
+    log_body_limit = int(os.getenv('API_LOG_BODY_LIMIT', '2000'))
+    log_compact = os.getenv('API_LOG_COMPACT', 'false').lower() == 'true'
+
+    def __init__(self, session=None, headers: dict = None):
         super().__init__()
         self.host = '[API Utils]'
-        self.session = session
+        # Pooled sessions keep connections alive across tests, headers stay per API object
+        self.session = session if session is not None else HttpSessionPool().get(self.base_url)
+        self.headers = dict(headers or {})
         self.log = HandleLog()
         
     def get_request(self, show_log=True, **kwargs):
@@ -27,44 +36,72 @@ class APIUtils():
     def _request(self, method, show_log=True, **kwargs):
         try:
             self._last_url = kwargs.get("url")
-            request_log = {
-                k: v for k, v in {
-                    "method": method.upper(),
-                    "url": self._last_url,
-                    "headers": dict(self.session.headers),
-                    "params": kwargs.get("params"),
-                    "data": kwargs.get("data"),
-                    "json": kwargs.get("json"),
-                }.items() if v is not None
-            }
-            self.log.info_log(f"{json.dumps(request_log, indent=4, ensure_ascii=False)}")
+            kwargs["headers"] = {**self.headers, **(kwargs.get("headers") or {})}
+            # Skip building and serializing the request log when INFO is off
+            if self.log.is_enabled("INFO"):
+                request_log = {
+                    k: v for k, v in {
+                        "method": method.upper(),
+                        "url": self._last_url,
+                        "headers": {**self.session.headers, **kwargs["headers"]},
+                        "params": kwargs.get("params"),
+                        "data": kwargs.get("data"),
+                        "json": kwargs.get("json"),
+                    }.items() if v is not None
+                }
+                self.log.info_log(self._format_log_data(request_log))
             
             try:
-                self.response = self.session.request(
+                self.response = APIResponse(self.session.request(
                     method, 
                     verify=self.session.verify,
                     **kwargs
-                )
+                ))
             
             except ConnectionError as e:
                 raise SendRequestError(f'{self.host} Request failed: {str(e)}')
             
             self.log.info_log(f'{self.host} Response code: {self.response.status_code}')
-            try:
-                response_content = self.response.json()
-                if show_log:
-                    self.log.info_log(f'{self.host} Response content: {json.dumps(response_content, indent=4, ensure_ascii=False)}')
-                    
-            except ValueError:
-                if show_log:
-                    self.log.info_log(f'{self.host} Response content: {self.response.text[:200]}...')
-                
+            if show_log:
+                self.log.info_log(f'{self.host} Response content: %s', LazyLogValue(self._format_response_body))
+
             return self.response
             
         except requests.exceptions.RequestException as e:
             self.log.error_log(f'{self.host} Request failed: {str(e)}')
             raise SendRequestError(f'{self.host} Request failed: {str(e)}')
         
+    @property
+    def last_metrics(self) -> dict:
+        # decode_ms stays None until something reads the JSON body
+        response = self.response
+        return {
+            "method": response.request.method,
+            "url": self._last_url,
+            "status_code": response.status_code,
+            "elapsed_ms": round(response.elapsed.total_seconds() * 1000, 3),
+            "body_bytes": len(response.content),
+            "decode_ms": round(response.decode_time * 1000, 3) if response.is_decoded else None,
+        }
+
+    def _format_log_data(self, data) -> str:
+        if self.log_compact:
+            text = json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+        else:
+            text = json.dumps(data, indent=4, ensure_ascii=False, default=str)
+        return self._truncate_log_text(text)
+
+    def _format_response_body(self) -> str:
+        try:
+            return self._format_log_data(self.response.json())
+        except ValueError:
+            return self._truncate_log_text(self.response.text)
+
+    def _truncate_log_text(self, text: str) -> str:
+        if self.log_body_limit and len(text) > self.log_body_limit:
+            return f"{text[:self.log_body_limit]}... ({len(text) - self.log_body_limit} more chars)"
+        return text
+
     def check_status_success(self):
         status_code = self.response.status_code
         self.log.info_log(f"check_status_code {status_code}")
@@ -110,6 +147,7 @@ class APIUtils():
 
     def get_response_data(self, key=None) -> dict:
         response_data = self.response.json()
+        self.log.info_log(f"{self.host} Request metrics: %s", LazyLogValue(lambda: self.last_metrics))
         if key:
             return response_data[key]
         else:
@@ -0,0 +1,86 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from time import perf_counter
+from library.logger import HandleLog
+
+
+class APICaseResult:
+    def __init__(self, case, value=None, error: Exception = None, duration: float = 0.0):
+        self.case = case
+        self.value = value
+        self.error = error
+        self.duration = duration
+
+    @property
+    def case_id(self):
+        return self.case.get("test_id") if isinstance(self.case, dict) else self.case
+
+    @property
+    def is_success(self) -> bool:
+        return self.error is None
+
+    def __repr__(self):
+        status = "ok" if self.is_success else f"error: {self.error}"
+        return f"APICaseResult(case={self.case_id!r}, {status}, {self.duration:.2f}s)"
+
+
+class AsyncAPIClient:
+    # APIUtils keeps the last response on the object, so every call gets a fresh API object
+    # from api_factory and returns it once done; the fluent checks then run on that object.
+    # The pooled session underneath is shared, so concurrent calls reuse kept-alive connections.
+    def __init__(self, api_factory, max_concurrency: int = 8):
+        self.host = '[AsyncAPIClient]'
+        self.api_factory = api_factory
+        self.max_concurrency = max_concurrency
+        self.log = HandleLog()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="api")
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        async def endpoint(*args, **kwargs):
+            return await self.call(name, *args, **kwargs)
+        return endpoint
+
+    async def call(self, method_name: str, *args, **kwargs):
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, partial(self._call, method_name, *args, **kwargs))
+
+    def _call(self, method_name: str, *args, **kwargs):
+        api = self.api_factory()
+        getattr(api, method_name)(*args, **kwargs)
+        return api
+
+    async def run_cases(self, cases: list, case_flow) -> list:
+        # case_flow(client, case) is a coroutine; one failing case does not stop the others
+        async def run_case(case):
+            start_time = perf_counter()
+            try:
+                value = await case_flow(self, case)
+                return APICaseResult(case, value=value, duration=perf_counter() - start_time)
+            except Exception as e:
+                result = APICaseResult(case, error=e, duration=perf_counter() - start_time)
+                self.log.error_log(f"{self.host} Case {result.case_id!r} failed: {e}")
+                return result
+
+        start_time = perf_counter()
+        results = await asyncio.gather(*(run_case(case) for case in cases))
+        failed = sum(1 for result in results if not result.is_success)
+        self.log.info_log(
+            f"{self.host} Run {len(cases)} case(s) with concurrency {self.max_concurrency} "
+            f"in {perf_counter() - start_time:.2f}s, failed: {failed}"
+        )
+        return results
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
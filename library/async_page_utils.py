@@ -0,0 +1,56 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
+from selenium import webdriver
+from library.logger import HandleLog
+from library.page_utils import PageUtils
+
+
+class AsyncPage:
+    # Async view of a page object: blocking methods become coroutines run on the session thread,
+    # locator methods and plain attributes are returned as they are
+    def __init__(self, page, session: "AsyncBrowserSession"):
+        self._page = page
+        self._session = session
+
+    def __getattr__(self, name):
+        attribute = getattr(self._page, name)
+
+        if getattr(attribute, "is_locator", False):
+            return attribute
+        # Nested page objects, e.g. TwitchPages.search
+        if isinstance(attribute, PageUtils):
+            return AsyncPage(attribute, self._session)
+        if callable(attribute):
+            return self._session.wrap(attribute)
+        return attribute
+
+
+class AsyncBrowserSession:
+    # A WebDriver session is not thread-safe, so every command of one session goes through
+    # its own single worker thread; several sessions then run side by side under asyncio.gather
+    def __init__(self, driver: webdriver.Remote, name: str = "session", **page_utils_kwargs):
+        self.host = f'[AsyncBrowserSession:{name}]'
+        self.driver = driver
+        self.name = name
+        self.log = HandleLog()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"webdriver-{name}")
+        self.page_utils = AsyncPage(PageUtils(driver, **page_utils_kwargs), self)
+
+    async def run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    def wrap(self, func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            return await self.run(func, *args, **kwargs)
+        return wrapper
+
+    async def page(self, page_factory) -> AsyncPage:
+        # Page objects may talk to the driver in __init__, so build them on the session thread too
+        return AsyncPage(await self.run(page_factory, self.driver), self)
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        self.log.info_log(f"{self.host} Session closed")
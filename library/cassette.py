@@ -0,0 +1,133 @@
+import base64, hashlib, json, os
+from datetime import timedelta
+from threading import Lock
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from library.exception import CassetteMissError
+from library.logger import HandleLog
+
+
+class Cassette:
+    MODES = ["live", "record", "replay"]
+    # Auth headers only count by presence and only to pick between otherwise identical recordings
+    MATCH_HEADERS = ("x-api-key", "authorization")
+    # The stored body is already decoded, framing headers of the original transfer no longer apply
+    DROP_RESPONSE_HEADERS = {"content-encoding", "transfer-encoding", "content-length", "connection", "set-cookie"}
+
+    def __init__(self, file_path: str, mode: str = "replay"):
+        self.host = '[Cassette]'
+        self.file_path = file_path
+        self.mode = mode
+        self.log = HandleLog()
+        self.interactions = []
+        self._replay = {}
+        self._lock = Lock()
+
+        if mode == "replay" and os.path.exists(file_path):
+            with open(file_path, "r", encoding="utf-8") as f:
+                self.interactions = json.load(f)["interactions"]
+            for interaction in self.interactions:
+                request = interaction["request"]
+                self._replay.setdefault(self._match_key(request), []).append(
+                    {"auth": request["auth"], "response": interaction["response"], "is_played": False}
+                )
+
+    def _request_fingerprint(self, request: requests.PreparedRequest) -> dict:
+        body = request.body or b""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        return {
+            "method": request.method,
+            "url": request.url,
+            "body_sha1": hashlib.sha1(body).hexdigest() if body else None,
+            "auth": sorted(name for name in self.MATCH_HEADERS if name in request.headers),
+        }
+
+    def _match_key(self, fingerprint: dict) -> tuple:
+        return fingerprint["method"], fingerprint["url"], fingerprint["body_sha1"]
+
+    def record(self, request: requests.PreparedRequest, response: requests.Response):
+        stored_response = {
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {
+                name: value for name, value in response.headers.items()
+                if name.lower() not in self.DROP_RESPONSE_HEADERS
+            },
+        }
+        try:
+            stored_response["body"] = response.content.decode("utf-8")
+        except UnicodeDecodeError:
+            stored_response["body_base64"] = base64.b64encode(response.content).decode("ascii")
+
+        with self._lock:
+            self.interactions.append({"request": self._request_fingerprint(request), "response": stored_response})
+
+    def play(self, request: requests.PreparedRequest) -> requests.Response:
+        fingerprint = self._request_fingerprint(request)
+        with self._lock:
+            candidates = self._replay.get(self._match_key(fingerprint))
+            if not candidates:
+                raise CassetteMissError(
+                    f"{self.host} No recorded response for {request.method} {request.url} in {self.file_path}, "
+                    f"record it with --api-mode=record"
+                )
+
+            # Prefer a recording made with the same auth headers present, but a replay without
+            # the API key (e.g. offline CI) still gets the response recorded with it
+            same_auth = [candidate for candidate in candidates if candidate["auth"] == fingerprint["auth"]]
+            candidates = same_auth or candidates
+
+            # Identical requests get their responses in recorded order, the last one repeats
+            candidate = next((candidate for candidate in candidates if not candidate["is_played"]), candidates[-1])
+            candidate["is_played"] = True
+            stored_response = candidate["response"]
+
+        response = requests.Response()
+        response.status_code = stored_response["status"]
+        response.reason = stored_response["reason"]
+        response.headers = CaseInsensitiveDict(stored_response["headers"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = (
+            stored_response["body"].encode("utf-8") if "body" in stored_response
+            else base64.b64decode(stored_response["body_base64"])
+        )
+        response.url = request.url
+        response.request = request
+        response.elapsed = timedelta(0)
+        return response
+
+    def save(self):
+        if not self.interactions:
+            return
+
+        os.makedirs(os.path.dirname(self.file_path) or ".", exist_ok=True)
+        with open(self.file_path, "w", encoding="utf-8") as f:
+            json.dump({"interactions": self.interactions}, f, separators=(",", ":"), ensure_ascii=False)
+        self.log.info_log(f"{self.host} Recorded {len(self.interactions)} interaction(s) to {self.file_path}")
+
+
+class CassetteAdapter(BaseAdapter):
+    # Mounted on pooled sessions: live traffic goes through the real adapter,
+    # the active cassette (if any) records it or answers it from memory
+    def __init__(self, live_adapter: BaseAdapter):
+        super().__init__()
+        self.live_adapter = live_adapter
+        self.cassette = None
+
+    def send(self, request, **kwargs):
+        cassette = self.cassette
+        if cassette is not None and cassette.mode == "replay":
+            response = cassette.play(request)
+            response.connection = self
+            return response
+
+        response = self.live_adapter.send(request, **kwargs)
+        if cassette is not None and cassette.mode == "record":
+            cassette.record(request, response)
+        return response
+
+    def close(self):
+        self.live_adapter.close()
@@ -0,0 +1,106 @@
+import json, os
+from bisect import bisect_left
+from time import perf_counter
+from selenium import webdriver
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+from library.element import LocatorRegistry
+from library.tracing import Tracer
+
+
+class CommandTimer:
+    BUCKETS_MS = [1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+    FIND_COMMANDS = {Command.FIND_ELEMENT, Command.FIND_ELEMENTS, Command.FIND_CHILD_ELEMENT, Command.FIND_CHILD_ELEMENTS}
+
+    def __init__(self, driver: webdriver.Remote):
+        self.driver = driver
+        self._original_execute = driver.execute
+        self._element_locators = {}
+        self.command_samples = {}
+        self.element_samples = {}
+
+    @classmethod
+    def attach(cls, driver: webdriver.Remote) -> "CommandTimer":
+        # One timer per driver, pooled drivers keep theirs between tests
+        timer = getattr(driver, "_command_timer", None)
+        if timer is None:
+            timer = cls(driver)
+            driver.execute = timer._timed_execute
+            driver._command_timer = timer
+        return timer
+
+    def reset(self):
+        self._element_locators.clear()
+        self.command_samples = {}
+        self.element_samples = {}
+
+    def _timed_execute(self, driver_command: str, params: dict = None):
+        start_time = perf_counter()
+        response = None
+        try:
+            response = self._original_execute(driver_command, params)
+            return response
+        finally:
+            duration = perf_counter() - start_time
+            duration_ms = duration * 1000
+            self.command_samples.setdefault(driver_command, []).append(duration_ms)
+
+            locator_key = self._get_locator_key(driver_command, params, response)
+            if locator_key:
+                self.element_samples.setdefault(locator_key, []).append(duration_ms)
+
+            Tracer().add_complete_event(
+                driver_command, "webdriver", start_time, duration, {"locator": locator_key} if locator_key else None
+            )
+
+    def _get_locator_key(self, driver_command: str, params: dict, response: dict) -> str:
+        params = params or {}
+
+        if driver_command in self.FIND_COMMANDS:
+            locator_key = self._format_locator(params.get("using"), params.get("value"))
+
+            # Remember which locator produced each element, so later element commands are attributed to it
+            found = (response or {}).get("value")
+            for web_element in found if isinstance(found, list) else [found]:
+                if isinstance(web_element, WebElement):
+                    self._element_locators[web_element.id] = locator_key
+            return locator_key
+
+        return self._element_locators.get(params.get("id"))
+
+    def _format_locator(self, by: str, selector: str) -> str:
+        element = LocatorRegistry.lookup(by, selector)
+        name = f"<{element.name}> " if element else ""
+        return f"{name}{by}: {selector}"
+
+    def snapshot(self) -> dict:
+        return {
+            "commands": {command: self._histogram(samples) for command, samples in self.command_samples.items()},
+            "elements": {locator_key: self._histogram(samples) for locator_key, samples in self.element_samples.items()},
+        }
+
+    def _histogram(self, samples: list) -> dict:
+        ordered = sorted(samples)
+        buckets = {f"<={bucket}ms": 0 for bucket in self.BUCKETS_MS}
+        buckets[f">{self.BUCKETS_MS[-1]}ms"] = 0
+
+        for sample in ordered:
+            index = bisect_left(self.BUCKETS_MS, sample)
+            key = f"<={self.BUCKETS_MS[index]}ms" if index < len(self.BUCKETS_MS) else f">{self.BUCKETS_MS[-1]}ms"
+            buckets[key] += 1
+
+        return {
+            "count": len(ordered),
+            "total_ms": round(sum(ordered), 3),
+            "min_ms": round(ordered[0], 3),
+            "p50_ms": round(ordered[len(ordered) // 2], 3),
+            "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+            "max_ms": round(ordered[-1], 3),
+            "buckets": {key: count for key, count in buckets.items() if count},
+        }
+
+    @staticmethod
+    def export_json(timings: dict, file_path: str):
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(timings, f, indent=4)
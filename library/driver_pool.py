@@ -0,0 +1,174 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from queue import Queue, Empty
+from urllib.parse import urlsplit
+from selenium import webdriver
+from library.logger import HandleLog
+from library.exception import DriverPoolException
+
+
+class DriverPool:
+    RESET_URL = "about:blank"
+
+    def __init__(self, driver_factory, size: int = 1, health_check_timeout: int = 10, acquire_timeout: int = 120):
+        self.host = '[DriverPool]'
+        self.log = HandleLog()
+        self.driver_factory = driver_factory
+        self.size = size
+        self.health_check_timeout = health_check_timeout
+        self.acquire_timeout = acquire_timeout
+        self._idle = Queue()
+        self._all_drivers = []
+        self._creating = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _create_driver(self) -> webdriver.Remote:
+        try:
+            driver = self.driver_factory()
+        except Exception:
+            with self._lock:
+                self._creating -= 1
+            raise
+
+        with self._lock:
+            self._creating -= 1
+            self._all_drivers.append(driver)
+        self.log.info_log(f"{self.host} Create driver, total: {len(self._all_drivers)}/{self.size}")
+        return driver
+
+    def acquire(self, timeout: int = None) -> webdriver.Remote:
+        if self._closed:
+            raise DriverPoolException(f"{self.host} Acquire driver failed: pool is closed")
+
+        # Never wait forever, a driver that was not released would otherwise hang the whole run
+        timeout = self.acquire_timeout if timeout is None else timeout
+
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except Empty:
+                # Reserve the slot under the lock, concurrent acquires must not overshoot the size
+                with self._lock:
+                    can_create = len(self._all_drivers) + self._creating < self.size
+                    if can_create:
+                        self._creating += 1
+                if can_create:
+                    return self._create_driver()
+
+                try:
+                    driver = self._idle.get(timeout=timeout)
+                except Empty:
+                    raise DriverPoolException(f"{self.host} Acquire driver failed: no idle driver after {timeout} seconds")
+
+            # Idle drivers may have died between tests (e.g. browser crashed)
+            if self._is_healthy(driver):
+                return driver
+            self.discard(driver)
+
+    def release(self, driver: webdriver.Remote):
+        if self._closed:
+            self._quit(driver)
+            return
+
+        if self._run_with_timeout(self._reset_state, driver):
+            self._idle.put(driver)
+            self.log.info_log(f"{self.host} Release driver to pool")
+        else:
+            self.discard(driver)
+
+    def discard(self, driver: webdriver.Remote):
+        with self._lock:
+            if driver in self._all_drivers:
+                self._all_drivers.remove(driver)
+        self.log.warning_log(f"{self.host} Discard unhealthy driver, remaining: {len(self._all_drivers)}")
+
+        # A hung driver may never return from quit(), so do not block the caller
+        threading.Thread(target=self._quit, args=(driver,), daemon=True).start()
+
+    def close(self):
+        self._closed = True
+        with self._lock:
+            drivers, self._all_drivers = self._all_drivers, []
+
+        for driver in drivers:
+            self._quit(driver)
+        self.log.info_log(f"{self.host} Pool closed, quit {len(drivers)} driver(s)")
+
+    def _is_healthy(self, driver: webdriver.Remote) -> bool:
+        return self._run_with_timeout(lambda d: d.execute_script("return 1") == 1, driver)
+
+    def _run_with_timeout(self, func, driver: webdriver.Remote) -> bool:
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            return bool(executor.submit(func, driver).result(timeout=self.health_check_timeout))
+        except FutureTimeoutError:
+            self.log.error_log(f"{self.host} Driver not responding after {self.health_check_timeout} seconds")
+            return False
+        except Exception as e:
+            self.log.error_log(f"{self.host} Driver health check failed: {e}")
+            return False
+        finally:
+            executor.shutdown(wait=False)
+
+    def _reset_state(self, driver: webdriver.Remote) -> bool:
+        handles = driver.window_handles
+        main_handle = handles[0]
+        is_chromium = hasattr(driver, "execute_cdp_cmd")
+        origins = set()
+
+        # Close extra windows and tabs opened by the test, remembering which origins they visited
+        for handle in reversed(handles):
+            driver.switch_to.window(handle)
+            if is_chromium:
+                origins |= self._get_visited_origins(driver)
+            if handle != main_handle:
+                driver.close()
+        driver.switch_to.window(main_handle)
+
+        if is_chromium:
+            # Storage.clearDataForOrigin also covers IndexedDB, Cache Storage and service workers,
+            # which page JS cannot reach for origins the tab has already left
+            for cookie in driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]:
+                domain = cookie["domain"].lstrip(".")
+                origins |= {f"https://{domain}", f"http://{domain}"}
+            for origin in origins:
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+
+            # WebDriver only deletes cookies of the current domain, CDP clears all of them
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+
+            # Scripts injected into new documents (e.g. the network tracker) must not run in later tests
+            new_document_scripts = getattr(driver, "_new_document_scripts", {})
+            for identifier in new_document_scripts.values():
+                try:
+                    driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": identifier})
+                except Exception as e:
+                    # Registered in a tab that is closed by now, gone with it
+                    self.log.debug_log(f"{self.host} Remove new document script failed: {e}")
+            new_document_scripts.clear()
+
+            driver.get(self.RESET_URL)
+            driver.execute_cdp_cmd("Page.resetNavigationHistory", {})
+        else:
+            driver.execute_script("""
+                try { window.localStorage.clear(); } catch (e) {}
+                try { window.sessionStorage.clear(); } catch (e) {}
+            """)
+            driver.delete_all_cookies()
+            driver.get(self.RESET_URL)
+        return True
+
+    def _get_visited_origins(self, driver: webdriver.Remote) -> set:
+        origins = set()
+        for entry in driver.execute_cdp_cmd("Page.getNavigationHistory", {})["entries"]:
+            url = urlsplit(entry["url"])
+            if url.scheme in ("http", "https"):
+                origins.add(f"{url.scheme}://{url.netloc}")
+        return origins
+
+    def _quit(self, driver: webdriver.Remote):
+        try:
+            driver.quit()
+        except Exception as e:
+            self.log.debug_log(f"{self.host} Quit driver failed: {e}")
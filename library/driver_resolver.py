@@ -0,0 +1,113 @@
+import json, os, time
+from contextlib import contextmanager
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+from library.logger import HandleLog
+from library.exception import DriverResolverException
+
+
+class ChromeDriverResolver:
+    DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "opennet-selenium", "chromedriver")
+    UNKNOWN_VERSION = "unknown"
+
+    def __init__(self, cache_dir: str = None, lock_timeout: int = 120):
+        self.host = '[ChromeDriverResolver]'
+        self.log = HandleLog()
+        self.cache_dir = cache_dir or os.getenv('CHROMEDRIVER_CACHE_DIR', self.DEFAULT_CACHE_DIR)
+        self.index_path = os.path.join(self.cache_dir, "index.json")
+        self.lock_path = os.path.join(self.cache_dir, ".lock")
+        self.lock_timeout = lock_timeout
+
+    def get_chrome_major_version(self) -> str:
+        # Reads the local Chrome binary, no network access needed
+        try:
+            version = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+        except Exception as e:
+            self.log.debug_log(f"{self.host} Detect Chrome version failed: {e}")
+            version = None
+
+        return version.split(".")[0] if version else self.UNKNOWN_VERSION
+
+    def resolve_cached(self, major_version: str = None) -> str:
+        major_version = major_version or self.get_chrome_major_version()
+        # Without a known version a cached path may belong to an older Chrome, never serve it
+        if major_version == self.UNKNOWN_VERSION:
+            return None
+
+        driver_path = self._read_index().get(major_version)
+
+        if driver_path and os.path.exists(driver_path):
+            self.log.info_log(f"{self.host} Cache hit for Chrome {major_version}: {driver_path}")
+            return driver_path
+        return None
+
+    def resolve(self) -> str:
+        major_version = self.get_chrome_major_version()
+        driver_path = self.resolve_cached(major_version)
+        if driver_path:
+            return driver_path
+
+        # Only one process downloads, the others wait and then read the warm cache
+        with self._file_lock():
+            driver_path = self.resolve_cached(major_version)
+            if driver_path:
+                return driver_path
+
+            self.log.info_log(f"{self.host} Cache miss for Chrome {major_version}, resolving with ChromeDriverManager")
+            try:
+                driver_path = ChromeDriverManager().install()
+            except Exception as e:
+                raise DriverResolverException(
+                    f"{self.host} Resolve chromedriver for Chrome {major_version} failed and no cached binary found "
+                    f"in {self.cache_dir}: {e}"
+                )
+
+            if major_version != self.UNKNOWN_VERSION:
+                index = self._read_index()
+                index[major_version] = driver_path
+                self._write_index(index)
+            return driver_path
+
+    def _read_index(self) -> dict:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write_index(self, index: dict):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=4)
+        os.replace(tmp_path, self.index_path)
+
+    @contextmanager
+    def _file_lock(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        deadline = time.monotonic() + self.lock_timeout
+
+        while True:
+            try:
+                fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                if time.monotonic() > deadline:
+                    # Lock left behind by a killed process
+                    self.log.warning_log(f"{self.host} Lock wait timeout, removing stale lock: {self.lock_path}")
+                    self._remove_lock()
+                    deadline = time.monotonic() + self.lock_timeout
+                time.sleep(0.2)
+
+        try:
+            os.write(fd, str(os.getpid()).encode())
+            yield
+        finally:
+            os.close(fd)
+            self._remove_lock()
+
+    def _remove_lock(self):
+        try:
+            os.remove(self.lock_path)
+        except FileNotFoundError:
+            pass
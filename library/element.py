@@ -1,20 +1,94 @@
+import inspect
+from functools import wraps
 from selenium.webdriver.common.by import By
 
 class Element:
-    def __init__(self, name: str, locator: tuple = None, by: By = None, selector: str = None):
-        self.name = name
+    # Immutable and hashable on (by, selector), so it can be used as a cache key
+    __slots__ = ("name", "by", "selector")
 
+    def __init__(self, name: str, locator: tuple = None, by: By = None, selector: str = None):
         # Support both formats: locator tuple or by+selector
         if locator is not None:
-            self.locator = locator
-            self.by = locator[0]
-            self.selector = locator[1]
-        elif by is not None and selector is not None:
-            self.by = by
-            self.selector = selector
-            self.locator = (by, selector)
-        else:
+            by, selector = locator[0], locator[1]
+        elif by is None or selector is None:
             raise ValueError("Must provide either 'locator' tuple or both 'by' and 'selector'")
 
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "by", by)
+        object.__setattr__(self, "selector", selector)
+
+    @property
+    def locator(self) -> tuple:
+        return (self.by, self.selector)
+
+    def nth(self, index: int) -> "Element":
+        # 1-based, same as XPath positions; other strategies go through PageUtils.find_nth_element
+        if self.by != By.XPATH:
+            raise ValueError(f"nth() needs an XPath locator, got '{self.by}': {self}")
+        if index < 1:
+            raise ValueError(f"Index starts from 1, got {index}")
+        return Element(name=f"{self.name} #{index}", by=self.by, selector=f"({self.selector})[{index}]")
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"Element is immutable, cannot set '{key}'")
+
+    def __delattr__(self, key):
+        raise AttributeError(f"Element is immutable, cannot delete '{key}'")
+
+    def __eq__(self, other):
+        if not isinstance(other, Element):
+            return NotImplemented
+        return self.by == other.by and self.selector == other.selector
+
+    def __hash__(self):
+        return hash((self.by, self.selector))
+
+    def __reduce__(self):
+        return (Element, (self.name, None, self.by, self.selector))
+
+    def __repr__(self):
+        return f"Element(name={self.name!r}, by={self.by!r}, selector={self.selector!r})"
+
     def __str__(self):
-        return f"Element: <{self.name}> Location: <{self.by}: {self.selector}>"
\ No newline at end of file
+        return f"Element: <{self.name}> Location: <{self.by}: {self.selector}>"
+
+
+# Every Element built through @locator, so instrumentation can map (by, selector) back to a name
+_registered_elements = {}
+
+
+def locator(func):
+    # Build the Element once per locator method and arguments, then reuse it
+    elements = {}
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        element = elements.get(key)
+        if element is None:
+            element = elements[key] = func(self, *args, **kwargs)
+            _registered_elements.setdefault(element, element)
+        return element
+
+    wrapper.is_locator = True
+    return wrapper
+
+
+class LocatorRegistry:
+    @staticmethod
+    def lookup(by: str, selector: str) -> Element:
+        return _registered_elements.get(Element(name="", by=by, selector=selector))
+
+    @classmethod
+    def list_elements(cls) -> dict:
+        elements = {}
+        for attr_name in dir(cls):
+            method = getattr(cls, attr_name)
+            if not getattr(method, "is_locator", False):
+                continue
+
+            # Only locators that can be built without arguments are listed up front
+            params = list(inspect.signature(method).parameters.values())[1:]
+            if all(param.default is not param.empty for param in params):
+                elements[attr_name] = method(None)
+        return elements
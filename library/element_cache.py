@@ -0,0 +1,88 @@
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+from library.logger import HandleLog
+from library.element import Element
+
+
+class ElementCache:
+    # Cheapest WebDriver call that both detects staleness and confirms the state
+    STATE_CHECKS = {
+        "located": lambda web_element: web_element.tag_name is not None,
+        "visible": lambda web_element: web_element.is_displayed(),
+        "clickable": lambda web_element: web_element.is_displayed() and web_element.is_enabled(),
+    }
+
+    # Commands after which no cached element can be trusted any more
+    INVALIDATING_COMMANDS = {
+        Command.GET: "navigate",
+        Command.REFRESH: "refresh",
+        Command.GO_BACK: "go back",
+        Command.GO_FORWARD: "go forward",
+        Command.SWITCH_TO_WINDOW: "switch window",
+        Command.NEW_WINDOW: "new window",
+        Command.CLOSE: "close window",
+    }
+
+    def __init__(self):
+        self.host = '[ElementCache]'
+        self.log = HandleLog()
+        self._web_elements = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @classmethod
+    def attach(cls, driver: webdriver.Remote) -> "ElementCache":
+        # One cache per driver, shared by every page object on it, so a navigation or window switch
+        # made anywhere (another PageUtils, TabPool, the raw driver) clears it
+        cache = getattr(driver, "_element_cache", None)
+        if cache is None:
+            cache = cls()
+            original_execute = driver.execute
+
+            def execute(driver_command: str, params: dict = None):
+                reason = cls.INVALIDATING_COMMANDS.get(driver_command)
+                if reason:
+                    cache.invalidate(reason)
+                return original_execute(driver_command, params)
+
+            driver.execute = execute
+            driver._element_cache = cache
+        return cache
+
+    def get(self, element: Element, state: str = "located") -> WebElement:
+        web_element = self._web_elements.get(element)
+
+        if web_element is not None:
+            try:
+                if self.STATE_CHECKS[state](web_element):
+                    self.hits += 1
+                    return web_element
+
+            except WebDriverException:
+                # Stale or gone with its document, resolve it again
+                del self._web_elements[element]
+
+        self.misses += 1
+        return None
+
+    def put(self, element: Element, web_element: WebElement):
+        self._web_elements[element] = web_element
+
+    def invalidate(self, reason: str = ""):
+        if self._web_elements:
+            self.log.debug_log(f"{self.host} Invalidate {len(self._web_elements)} element(s): {reason}")
+            self._web_elements.clear()
+        self.invalidations += 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "size": len(self._web_elements),
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
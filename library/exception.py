@@ -18,6 +18,17 @@ class PageUtilsOtherException(PageUtilsException):
         super().__init__(message)
         self.message = message
 
+# ================= Driver Pool Exception =================
+class DriverPoolException(Exception):
+    def __init__(self, message):
+        super().__init__(message)
+        self.message = message
+
+class DriverResolverException(Exception):
+    def __init__(self, message):
+        super().__init__(message)
+        self.message = message
+
 class CustomException(Exception):
     def __init__(self, message):
         super().__init__(message)
@@ -80,6 +91,11 @@ class APIOtherStatusCodeError(Exception):
         self.message = message
 
 class CompareDataError(Exception):
+    def __init__(self, message):
+        super().__init__(message)
+        self.message = message
+
+class CassetteMissError(Exception):
     def __init__(self, message):
         super().__init__(message)
         self.message = message
\ No newline at end of file
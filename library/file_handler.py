@@ -1,4 +1,4 @@
-import json, os, glob
+import json, os, glob, re
 from library.logger import HandleLog
 
 class FileHandler:
@@ -40,6 +40,11 @@ class FileHandler:
             file_path = os.path.abspath(matches[0])
             return file_path
     
+    @staticmethod
+    def safe_file_name(name: str) -> str:
+        # e.g. a pytest node id "test_a.py::test_b[1]" -> "test_a.py_test_b_1"
+        return re.sub(r"[^\w.-]+", "_", name).strip("_")
+
     def check_file_exist(self, file_path):
         return os.path.exists(file_path)
     
@@ -0,0 +1,68 @@
+import requests
+from threading import Lock
+from requests.adapters import HTTPAdapter
+from library.cassette import CassetteAdapter
+from library.logger import HandleLog
+
+
+class HttpSessionPool:
+    _instance = None
+    _lock = Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.host = '[HttpSessionPool]'
+        self.log = HandleLog()
+        # One session per base URL, each with a small set of per-host pools and enough
+        # kept-alive connections for concurrent requests to the same host
+        self.pool_connections = 4
+        self.pool_maxsize = 16
+        self.cassette = None
+        self._sessions = {}
+        self._adapters = []
+
+    def get(self, base_url: str) -> requests.Session:
+        with self._lock:
+            session = self._sessions.get(base_url)
+            if session is None:
+                session = self._sessions[base_url] = self._create_session()
+                self.log.info_log(f"{self.host} Create session for {base_url}, total: {len(self._sessions)}")
+        return session
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = CassetteAdapter(HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize))
+        adapter.cassette = self.cassette
+        self._adapters.append(adapter)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def clear_cookies(self):
+        # Cookies live for one test (login then call still works), headers are per request in APIUtils
+        with self._lock:
+            sessions = list(self._sessions.values())
+        for session in sessions:
+            session.cookies.clear()
+
+    def use_cassette(self, cassette):
+        # Record or replay the traffic of every pooled session, None goes back to live
+        with self._lock:
+            self.cassette = cassette
+            for adapter in self._adapters:
+                adapter.cassette = cassette
+
+    def close(self):
+        with self._lock:
+            sessions, self._sessions = self._sessions, {}
+            self._adapters = []
+
+        for session in sessions.values():
+            session.close()
+        self.log.info_log(f"{self.host} Closed {len(sessions)} session(s)")
@@ -1,7 +1,7 @@
-import logging
+import logging, os
 from colorama import init, Fore
 from copy import copy
-from threading import Lock
+from threading import Lock, get_ident
 
 class ColoredFormatter(logging.Formatter):
     COLOR_MAP = {
@@ -23,6 +23,21 @@ class ColoredFormatter(logging.Formatter):
         return super().format(colored_record)
 
 
+class LazyLogValue:
+    # Passed as a logging argument: the value is only built when a record is actually emitted,
+    # and only once even if several handlers (console, Allure step file) format the record
+    def __init__(self, func, *args, **kwargs):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self._value = None
+
+    def __str__(self):
+        if self._value is None:
+            self._value = str(self.func(*self.args, **self.kwargs))
+        return self._value
+
+
 class HandleLog:
     _instance = None
     _lock = Lock()
@@ -37,7 +52,7 @@ class HandleLog:
     def _initialize(self):
         init(autoreset=True)
         self.logger = logging.getLogger('PlaywrightLogger')
-        self.logger.setLevel(logging.DEBUG)
+        self.logger.setLevel(self._get_level(os.getenv('LOG_LEVEL', 'DEBUG')))
         self.log_file_handlers = {}
         self.logger.propagate = False
 
@@ -50,6 +65,14 @@ class HandleLog:
         handler.setFormatter(formatter)
         self.logger.addHandler(handler)
 
+    @staticmethod
+    def _get_level(level_name: str) -> int:
+        level = logging.getLevelName(level_name.upper())
+        return level if isinstance(level, int) else logging.DEBUG
+
+    def is_enabled(self, level_name: str = "INFO") -> bool:
+        return self.logger.isEnabledFor(self._get_level(level_name))
+
     def add_file_handler(self, log_file_name):
         if log_file_name not in self.log_file_handlers:
             file_handler = logging.FileHandler(log_file_name, mode='w', encoding='utf-8')
@@ -59,6 +82,9 @@ class HandleLog:
                 datefmt='%H:%M:%S'
             )
             file_handler.setFormatter(formatter)
+            # Only capture the calling thread, so concurrent steps do not mix into each other's log
+            thread_id = get_ident()
+            file_handler.addFilter(lambda record: record.thread == thread_id)
             self.logger.addHandler(file_handler)
             self.log_file_handlers[log_file_name] = file_handler
 
@@ -69,33 +95,33 @@ class HandleLog:
             self.logger.removeHandler(handler)
             del self.log_file_handlers[log_file_name]
 
-    def info_log(self, message):
+    def info_log(self, message, *args):
         try:
-            self.logger.info(message)
+            self.logger.info(message, *args)
         except (ValueError, OSError, AttributeError):
             pass
         except Exception:
             pass
 
-    def warning_log(self, message):
+    def warning_log(self, message, *args):
         try:
-            self.logger.warning(message)
+            self.logger.warning(message, *args)
         except (ValueError, OSError, AttributeError):
             pass
         except Exception:
             pass
 
-    def error_log(self, message):
+    def error_log(self, message, *args):
         try:
-            self.logger.error(message)
+            self.logger.error(message, *args)
         except (ValueError, OSError, AttributeError):
             pass
         except Exception:
             pass
 
-    def debug_log(self, message):
+    def debug_log(self, message, *args):
         try:
-            self.logger.debug(message)
+            self.logger.debug(message, *args)
         except (ValueError, OSError, AttributeError):
             pass
         except Exception:
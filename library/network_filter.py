@@ -0,0 +1,117 @@
+import json
+from collections import Counter
+from selenium import webdriver
+from library.logger import HandleLog
+
+
+class NetworkFilter:
+    # Network.setBlockedURLs only matches URL patterns, so resource types map to patterns
+    RESOURCE_TYPE_PATTERNS = {
+        "image": ["*.png", "*.png?*", "*.jpg", "*.jpg?*", "*.jpeg", "*.jpeg?*", "*.gif", "*.gif?*",
+                  "*.webp", "*.webp?*", "*.svg", "*.svg?*", "*.ico", "*.avif"],
+        "font": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*fonts.googleapis.com*", "*fonts.gstatic.com*"],
+        "ads": ["*doubleclick.net*", "*googlesyndication.com*", "*amazon-adsystem.com*",
+                "*imasdk.googleapis.com*", "*adnxs.com*"],
+        "telemetry": ["*google-analytics.com*", "*googletagmanager.com*", "*scorecardresearch.com*",
+                      "*spade.twitch.tv*", "*countess.twitch.tv*", "*sentry.io*"],
+    }
+
+    def __init__(self, driver: webdriver.Remote, fallback_bytes_by_type: dict = None):
+        self.host = '[NetworkFilter]'
+        self.driver = driver
+        self.log = HandleLog()
+        self.blocked_patterns = []
+        # Assumed size per blocked request (keyed by CDP type, e.g. {"Image": 30000}) for types
+        # that never loaded during the test; without one the saving of that type is unknown
+        self.fallback_bytes_by_type = fallback_bytes_by_type or {}
+
+    @classmethod
+    def patterns_for(cls, resource_types: list = None, url_patterns: list = None) -> list:
+        patterns = []
+        for resource_type in resource_types or []:
+            if resource_type not in cls.RESOURCE_TYPE_PATTERNS:
+                raise ValueError(f"Invalid resource type: {resource_type}. Valid types: {', '.join(cls.RESOURCE_TYPE_PATTERNS)}")
+            patterns.extend(cls.RESOURCE_TYPE_PATTERNS[resource_type])
+
+        patterns.extend(url_patterns or [])
+        return list(dict.fromkeys(patterns))
+
+    def block(self, resource_types: list = None, url_patterns: list = None):
+        self.blocked_patterns = self.patterns_for(resource_types, url_patterns)
+
+        # Drop log entries left over from earlier tests on this pooled driver
+        self._read_network_events()
+
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_patterns})
+        self.log.info_log(f"{self.host} Block {len(self.blocked_patterns)} URL pattern(s), types: {resource_types or []}")
+
+    def clear(self):
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+        self.blocked_patterns = []
+
+    def collect_stats(self) -> dict:
+        request_types = {}
+        blocked_by_type = Counter()
+        transferred_by_type = Counter()
+        loaded_by_type = Counter()
+
+        for method, params in self._read_network_events():
+            request_id = params.get("requestId")
+
+            if method == "Network.requestWillBeSent":
+                request_types[request_id] = params.get("type", "Other")
+
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                blocked_by_type[params.get("type") or request_types.get(request_id, "Other")] += 1
+
+            elif method == "Network.loadingFinished":
+                resource_type = request_types.get(request_id, "Other")
+                loaded_by_type[resource_type] += 1
+                transferred_by_type[resource_type] += int(params.get("encodedDataLength", 0))
+
+        # Blocked requests never reach the network, so their size is estimated from the average
+        # size of requests of the same type that did load. A fully blocked type has no sample,
+        # its saving is unknown (None) rather than 0
+        saved_by_type = {}
+        for resource_type, count in blocked_by_type.items():
+            if loaded_by_type[resource_type]:
+                saved_by_type[resource_type] = count * transferred_by_type[resource_type] // loaded_by_type[resource_type]
+            elif resource_type in self.fallback_bytes_by_type:
+                saved_by_type[resource_type] = count * self.fallback_bytes_by_type[resource_type]
+            else:
+                saved_by_type[resource_type] = None
+
+        is_estimated = all(saved is not None for saved in saved_by_type.values())
+        estimated_bytes_saved = sum(saved_by_type.values()) if is_estimated else None
+
+        stats = {
+            "blocked_patterns": len(self.blocked_patterns),
+            "blocked_requests": sum(blocked_by_type.values()),
+            "blocked_by_type": dict(blocked_by_type),
+            "loaded_requests": sum(loaded_by_type.values()),
+            "transferred_bytes": sum(transferred_by_type.values()),
+            "estimated_bytes_saved": estimated_bytes_saved,
+            "estimated_bytes_saved_by_type": saved_by_type,
+        }
+        saved_text = f"{estimated_bytes_saved} bytes" if is_estimated else "unknown"
+        self.log.info_log(
+            f"{self.host} Blocked requests: {stats['blocked_requests']}, "
+            f"transferred: {stats['transferred_bytes']} bytes, estimated saved: {saved_text}"
+        )
+        return stats
+
+    def _read_network_events(self):
+        # Requires the 'performance' log, see get_chrome_options(network_logging=True)
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception as e:
+            self.log.debug_log(f"{self.host} Read performance log failed: {e}")
+            return []
+
+        events = []
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            if message.get("method", "").startswith("Network."):
+                events.append((message["method"], message.get("params", {})))
+        return events
@@ -0,0 +1,100 @@
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.keys import Keys
+from library.element import Element
+from library.logger import HandleLog
+
+
+class PageActions:
+    KEY_MAPPING = {
+        "Enter": Keys.RETURN,
+        "Tab": Keys.TAB,
+        "Escape": Keys.ESCAPE,
+        "ArrowDown": Keys.ARROW_DOWN,
+        "ArrowUp": Keys.ARROW_UP,
+    }
+
+    # Queues pointer, keyboard and wheel steps and sends them as one W3C Actions command
+    def __init__(self, page_utils, duration: int = 250):
+        self.host = '[PageActions]'
+        self.page_utils = page_utils
+        self.driver = page_utils.driver
+        self.duration = duration
+        self.log = HandleLog()
+        self._new_chain()
+
+    def _new_chain(self):
+        self._chain = ActionChains(self.driver, duration=self.duration)
+        self._steps = []
+
+    def _resolve(self, element):
+        if isinstance(element, Element):
+            return self.page_utils.find_element_located(element), element.name
+        return element, "element"
+
+    def scroll_to(self, element):
+        web_element, name = self._resolve(element)
+        self._chain.scroll_to_element(web_element)
+        self._steps.append(f"scroll to <{name}>")
+        return self
+
+    def scroll_by(self, x: int = 0, y: int = 0):
+        self._chain.scroll_by_amount(x, y)
+        self._steps.append(f"scroll by ({x}, {y})")
+        return self
+
+    def hover(self, element):
+        web_element, name = self._resolve(element)
+        self._chain.move_to_element(web_element)
+        self._steps.append(f"hover <{name}>")
+        return self
+
+    def click(self, element=None):
+        if element is None:
+            self._chain.click()
+            self._steps.append("click")
+        else:
+            web_element, name = self._resolve(element)
+            self._chain.click(web_element)
+            self._steps.append(f"click <{name}>")
+        return self
+
+    def double_click(self, element=None):
+        web_element, name = self._resolve(element) if element is not None else (None, "current position")
+        self._chain.double_click(web_element)
+        self._steps.append(f"double click <{name}>")
+        return self
+
+    def type(self, text: str, element=None):
+        # Typing into an element clicks it first to move the focus
+        if element is not None:
+            self.click(element)
+        self._chain.send_keys(text)
+        self._steps.append(f"type '{text}'")
+        return self
+
+    def key(self, key: str):
+        self._chain.send_keys(self.KEY_MAPPING.get(key, key))
+        self._steps.append(f"key {key}")
+        return self
+
+    def pause(self, seconds: float):
+        self._chain.pause(seconds)
+        self._steps.append(f"pause {seconds}s")
+        return self
+
+    def perform(self):
+        steps = " -> ".join(self._steps)
+        self.log.info_log(f"{self.host} Perform {len(self._steps)} action(s): {steps}")
+
+        try:
+            self._chain.perform()
+        except Exception:
+            # Release keys and buttons that may still be held down after a partial perform
+            try:
+                self._chain.reset_actions()
+            except Exception as e:
+                self.log.debug_log(f"{self.host} Release actions failed: {e}")
+            raise
+        finally:
+            # ActionBuilder drops the sent actions itself, start over so the step log matches the chain
+            self._new_chain()
@@ -0,0 +1,304 @@
+# ================= Shared in-page helpers =================
+# Locate elements with the same strategies as selenium's By, so an Element
+# can be resolved inside a single execute_script call
+ELEMENT_HELPERS_JS = """
+    function locateAll(by, selector) {
+        switch (by) {
+            case 'xpath': {
+                const result = document.evaluate(selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                const nodes = [];
+                for (let i = 0; i < result.snapshotLength; i++) nodes.push(result.snapshotItem(i));
+                return nodes;
+            }
+            case 'css selector': return Array.from(document.querySelectorAll(selector));
+            case 'id': return Array.from(document.querySelectorAll('#' + CSS.escape(selector)));
+            case 'name': return Array.from(document.getElementsByName(selector));
+            case 'class name': return Array.from(document.getElementsByClassName(selector));
+            case 'tag name': return Array.from(document.getElementsByTagName(selector));
+            case 'link text':
+                return Array.from(document.querySelectorAll('a')).filter(a => a.innerText.trim() === selector);
+            case 'partial link text':
+                return Array.from(document.querySelectorAll('a')).filter(a => a.innerText.includes(selector));
+            default: throw new Error('Unsupported locator strategy: ' + by);
+        }
+    }
+
+    function isVisible(el) {
+        if (!el || !el.isConnected) return false;
+        const style = window.getComputedStyle(el);
+        if (style.display === 'none' || style.visibility === 'hidden' || style.opacity === '0') return false;
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0;
+    }
+
+    function isEnabled(el) {
+        return !!el && !el.disabled && el.getAttribute('aria-disabled') !== 'true';
+    }
+
+    function describe(el) {
+        if (!el) return { present: false, visible: false, enabled: false, text: null, rect: null };
+        const rect = el.getBoundingClientRect();
+        return {
+            present: true,
+            visible: isVisible(el),
+            enabled: isEnabled(el),
+            text: el.innerText === undefined ? el.textContent : el.innerText,
+            rect: { x: rect.x, y: rect.y, width: rect.width, height: rect.height }
+        };
+    }
+
+    function matchState(info, state) {
+        switch (state) {
+            case 'present': return info.present;
+            case 'visible': return info.visible;
+            case 'invisible': return !info.visible;
+            case 'clickable': return info.visible && info.enabled;
+            case 'enabled': return info.present && info.enabled;
+            case 'disabled': return info.present && !info.enabled;
+            default: throw new Error('Unsupported state: ' + state);
+        }
+    }
+"""
+
+# arguments[0]: [[by, selector, state], ...] -> [{present, visible, enabled, text, rect, matched}, ...]
+QUERY_ELEMENTS_STATE_JS = ELEMENT_HELPERS_JS + """
+    return arguments[0].map(([by, selector, state]) => {
+        const info = describe(locateAll(by, selector)[0]);
+        info.matched = matchState(info, state);
+        return info;
+    });
+"""
+
+# arguments: by, selector, include_text, attributes, include_rect, columns, visible_only
+# -> [{text, <attribute>..., rect, <column>...}, ...], or null while visible_only is not satisfied yet
+EXTRACT_ELEMENTS_JS = ELEMENT_HELPERS_JS + """
+    const [by, selector, includeText, attributes, includeRect, columns, visibleOnly] = arguments;
+    const nodes = locateAll(by, selector);
+    if (visibleOnly && (nodes.length === 0 || !nodes.every(isVisible))) return null;
+
+    const textOf = (el) => el.innerText === undefined ? el.textContent : el.innerText;
+
+    // Same lookup order as WebElement.get_attribute: property first, then attribute
+    const attributeOf = (el, name) => {
+        const value = el[name];
+        return ['string', 'number', 'boolean'].includes(typeof value) ? value : el.getAttribute(name);
+    };
+
+    const cellOf = (el, cellSelector) => {
+        if (cellSelector.startsWith('.') || cellSelector.startsWith('/')) {
+            return document.evaluate(cellSelector, el, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        }
+        return el.querySelector(cellSelector);
+    };
+
+    return nodes.map(el => {
+        const row = {};
+        if (includeText) row.text = textOf(el);
+        for (const name of attributes) row[name] = attributeOf(el, name);
+        if (includeRect) {
+            const rect = el.getBoundingClientRect();
+            row.rect = { x: rect.x, y: rect.y, width: rect.width, height: rect.height };
+        }
+        for (const [name, cellSelector] of Object.entries(columns)) {
+            const cell = cellOf(el, cellSelector);
+            row[name] = cell ? textOf(cell) : null;
+        }
+        return row;
+    });
+"""
+
+# ================= Network idle / page timing =================
+# Counts in-flight fetch/XHR requests and records LCP. Installed on new documents
+# through CDP and, as a fallback, on the current document. Safe to run twice.
+NETWORK_TRACKER_JS = """
+    (() => {
+        if (window.__networkTracker) return;
+        const tracker = window.__networkTracker = { inflight: 0, lastActivity: performance.now(), lcp: null };
+        const begin = () => { tracker.inflight++; tracker.lastActivity = performance.now(); };
+        const end = () => { tracker.inflight = Math.max(0, tracker.inflight - 1); tracker.lastActivity = performance.now(); };
+
+        if (window.fetch) {
+            const originalFetch = window.fetch;
+            window.fetch = function (...args) {
+                begin();
+                return originalFetch.apply(this, args).finally(end);
+            };
+        }
+
+        const originalSend = XMLHttpRequest.prototype.send;
+        XMLHttpRequest.prototype.send = function (...args) {
+            begin();
+            this.addEventListener('loadend', end, { once: true });
+            return originalSend.apply(this, args);
+        };
+
+        try {
+            // Images, scripts and styles are not fetch/XHR, count their completion as activity
+            new PerformanceObserver(() => { tracker.lastActivity = performance.now(); })
+                .observe({ type: 'resource', buffered: false });
+            new PerformanceObserver((list) => {
+                const entries = list.getEntries();
+                tracker.lcp = entries[entries.length - 1].startTime;
+            }).observe({ type: 'largest-contentful-paint', buffered: true });
+        } catch (e) {}
+    })();
+"""
+
+# arguments: max_inflight, idle_ms, timeout_ms -> true once at most max_inflight requests were open for idle_ms
+WAIT_FOR_NETWORK_IDLE_JS = NETWORK_TRACKER_JS + """
+    const [maxInflight, idleMs, timeoutMs, done] = arguments;
+    const tracker = window.__networkTracker;
+    let idleSince = null;
+
+    const finish = (idle) => {
+        clearInterval(timer);
+        clearTimeout(guard);
+        done(idle);
+    };
+    const timer = setInterval(() => {
+        const now = performance.now();
+        if (tracker.inflight > maxInflight) {
+            idleSince = null;
+            return;
+        }
+        idleSince = Math.max(idleSince ?? now, tracker.lastActivity);
+        if (now - idleSince >= idleMs) finish(true);
+    }, 50);
+    const guard = setTimeout(() => finish(false), timeoutMs);
+"""
+
+# -> Navigation Timing (ms, relative to navigation start) and LCP
+PAGE_TIMING_JS = """
+    const navigation = performance.getEntriesByType('navigation')[0];
+    const tracker = window.__networkTracker;
+    const timing = navigation ? {
+        ttfb: navigation.responseStart,
+        response_end: navigation.responseEnd,
+        dom_interactive: navigation.domInteractive,
+        dom_content_loaded: navigation.domContentLoadedEventEnd,
+        load_event_end: navigation.loadEventEnd,
+        transfer_size: navigation.transferSize,
+        encoded_body_size: navigation.encodedBodySize
+    } : {};
+    const paints = {};
+    for (const entry of performance.getEntriesByType('paint')) paints[entry.name] = entry.startTime;
+
+    return {
+        url: location.href,
+        navigation: timing,
+        first_contentful_paint: paints['first-contentful-paint'] ?? null,
+        largest_contentful_paint: tracker ? tracker.lcp : null,
+        resource_count: performance.getEntriesByType('resource').length,
+        inflight_requests: tracker ? tracker.inflight : null
+    };
+"""
+
+# ================= Media playback =================
+MEDIA_HELPERS_JS = """
+    // Counters live on the element, so stalls after the wait can still be read later
+    function attachMediaStats(media) {
+        if (!media.__mediaStats) {
+            const stats = media.__mediaStats = { firstFrameAt: null, waiting: 0, stalled: 0 };
+            media.addEventListener('waiting', () => stats.waiting++);
+            media.addEventListener('stalled', () => stats.stalled++);
+        }
+        return media.__mediaStats;
+    }
+
+    function isMediaPlaying(media) {
+        return media.currentTime > 0 && media.readyState >= 3;
+    }
+
+    function mediaReport(media, playing, startedAt) {
+        if (!media) return { playing: false, found: false };
+        const stats = attachMediaStats(media);
+        const quality = media.getVideoPlaybackQuality ? media.getVideoPlaybackQuality() : null;
+        return {
+            playing: playing,
+            found: true,
+            time_to_first_frame_ms: stats.firstFrameAt !== null && startedAt !== null ? stats.firstFrameAt - startedAt : null,
+            first_frame_at_ms: stats.firstFrameAt,
+            current_time: media.currentTime,
+            ready_state: media.readyState,
+            dropped_frames: quality ? quality.droppedVideoFrames : null,
+            total_frames: quality ? quality.totalVideoFrames : null,
+            waiting_count: stats.waiting,
+            stalled_count: stats.stalled
+        };
+    }
+"""
+
+# arguments: css_selector, timeout_ms -> media report once playback started (or timed out)
+WAIT_FOR_MEDIA_PLAYING_JS = MEDIA_HELPERS_JS + """
+    const [selector, timeoutMs, done] = arguments;
+    const startedAt = performance.now();
+    let media = null;
+    let finished = false;
+
+    const finish = (playing) => {
+        if (finished) return;
+        finished = true;
+        clearInterval(findTimer);
+        clearTimeout(guard);
+        done(mediaReport(media, playing, startedAt));
+    };
+
+    const watch = (element) => {
+        media = element;
+        const stats = attachMediaStats(media);
+        if (isMediaPlaying(media)) {
+            // Already playing before the wait started, time to first frame is unknown
+            finish(true);
+            return;
+        }
+        const onProgress = () => {
+            if (!isMediaPlaying(media)) return;
+            stats.firstFrameAt = stats.firstFrameAt ?? performance.now();
+            media.removeEventListener('playing', onProgress);
+            media.removeEventListener('timeupdate', onProgress);
+            finish(true);
+        };
+        media.addEventListener('playing', onProgress);
+        media.addEventListener('timeupdate', onProgress);
+    };
+
+    // The player may not have created its media element yet
+    const findTimer = setInterval(() => {
+        const element = document.querySelector(selector);
+        if (element) {
+            clearInterval(findTimer);
+            watch(element);
+        }
+    }, 50);
+    const guard = setTimeout(() => finish(false), timeoutMs);
+"""
+
+# arguments: css_selector -> media report without waiting
+MEDIA_PLAYBACK_STATS_JS = MEDIA_HELPERS_JS + """
+    const media = document.querySelector(arguments[0]);
+    return mediaReport(media, !!media && isMediaPlaying(media), null);
+"""
+
+# arguments: by, selector, index (1-based) -> [match count, nth element or null, nth element visible]
+FIND_NTH_ELEMENT_JS = ELEMENT_HELPERS_JS + """
+    const [by, selector, index] = arguments;
+    const nodes = locateAll(by, selector);
+    const node = nodes[index - 1] || null;
+    return [nodes.length, node, isVisible(node)];
+"""
+
+# arguments: element, value, is_clear -> value after filling, or null if the element is not an input/textarea
+# The native setter bypasses React's value tracker, so the 'input' event is seen as a real change
+FAST_FILL_JS = """
+    const [el, value, isClear] = arguments;
+    const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+        : el instanceof HTMLInputElement ? HTMLInputElement.prototype : null;
+    if (!proto) return null;
+
+    const setValue = Object.getOwnPropertyDescriptor(proto, 'value').set;
+    el.focus();
+    setValue.call(el, isClear ? value : el.value + value);
+    el.dispatchEvent(new Event('input', { bubbles: true }));
+    el.dispatchEvent(new Event('change', { bubbles: true }));
+    return el.value;
+"""
@@ -1,6 +1,8 @@
 import allure
-import time
+import inspect
 import os
+import time
+from contextlib import contextmanager
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.support.ui import WebDriverWait
@@ -10,18 +12,35 @@ from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import TimeoutException, ElementClickInterceptedException
 from library.logger import HandleLog
 from library.element import Element
+from library.element_cache import ElementCache
+from library.page_actions import PageActions
+from library.tracing import Tracer
+from library.poll_scheduler import PollScheduler, BackoffPollScheduler, AdaptiveWebDriverWait
+from library.page_scripts import (
+    QUERY_ELEMENTS_STATE_JS, EXTRACT_ELEMENTS_JS, NETWORK_TRACKER_JS, WAIT_FOR_NETWORK_IDLE_JS, PAGE_TIMING_JS,
+    WAIT_FOR_MEDIA_PLAYING_JS, MEDIA_PLAYBACK_STATS_JS, FIND_NTH_ELEMENT_JS, FAST_FILL_JS
+)
 from library.exception import *
 
 
 def page_utils_exception(error_message_template):
     def decorator(func):
+        signature = inspect.signature(func)
+
         def wrapper(self, *args, **kwargs):
+            # Innermost running action, used to label wait stats
+            previous_action = getattr(self, '_current_action', None)
+            self._current_action = func.__name__
             try:
-                return func(self, *args, **kwargs)
+                with Tracer().span(f"PageUtils.{func.__name__}", "page_utils"):
+                    return func(self, *args, **kwargs)
 
             except TimeoutException:
-                format_kwargs = {**kwargs, 'self': self}
-                timeout_seconds = self.element_wait_time
+                # Bind positional arguments too, e.g. find_nth_element(element, 2) formats "{element}"
+                bound_arguments = signature.bind(self, *args, **kwargs)
+                bound_arguments.apply_defaults()
+                format_kwargs = bound_arguments.arguments
+                timeout_seconds = format_kwargs.get('timeout') or self.element_wait_time
                 error_msg = error_message_template.format(**format_kwargs)
                 raise PageUtilsTimeoutException(f"{error_msg}, timeout after {timeout_seconds} seconds")
 
@@ -36,24 +55,47 @@ def page_utils_exception(error_message_template):
                     f"    Error: {str(e)}"
                 )
 
+            finally:
+                self._current_action = previous_action
+
         return wrapper
     return decorator
 
 class PageUtils:
     DEFAULT_TIMEOUT = int(os.getenv('ELEMENT_TIMEOUT', '10'))
 
-    def __init__(self, driver: webdriver.Remote, element_wait_time: int = None, poll_frequency: float = 0.5):
+    def __init__(self, driver: webdriver.Remote, element_wait_time: int = None, poll_frequency: float = 0.5,
+                 use_element_cache: bool = False, poll_scheduler: PollScheduler = None):
         self.host = '[PageUtils]'
         self.driver = driver
+        self.element_cache = ElementCache.attach(driver) if use_element_cache else None
         self.element_wait_time = element_wait_time or self.DEFAULT_TIMEOUT
         self.poll_frequency = poll_frequency
+        # Fast polls first, then back off to poll_frequency
+        self.poll_scheduler = poll_scheduler or BackoffPollScheduler(max_interval=poll_frequency)
         self.browser_wait = WebDriverWait(driver, timeout=self.element_wait_time, poll_frequency=poll_frequency)
+        # Deprecated, kept for existing callers; new code should build steps with actions()
         self.action_chains = ActionChains(self.driver)
         self.log = HandleLog()
 
-    def _get_wait(self, timeout: int = None) -> WebDriverWait:
+    def _get_wait(self, timeout: int = None, poll_scheduler: PollScheduler = None) -> WebDriverWait:
         wait_time = timeout if timeout else self.element_wait_time
-        return WebDriverWait(self.driver, timeout=wait_time, poll_frequency=self.poll_frequency)
+        return AdaptiveWebDriverWait(
+            self.driver,
+            timeout=wait_time,
+            poll_scheduler=poll_scheduler or self.poll_scheduler,
+            label=getattr(self, '_current_action', None) or "wait"
+        )
+
+    @contextmanager
+    def using_poll_scheduler(self, poll_scheduler: PollScheduler):
+        # Override the poll scheduler for the waits inside the block
+        previous_scheduler = self.poll_scheduler
+        self.poll_scheduler = poll_scheduler
+        try:
+            yield self
+        finally:
+            self.poll_scheduler = previous_scheduler
 
     def _log_duration(self, start_time: datetime, action: str, element_name: str = None):
         end_time = datetime.now()
@@ -65,16 +107,48 @@ class PageUtils:
         else:
             self.log.info_log(f"{self.host} {action}, duration: {formatted_duration}s")
 
+    def _get_cached_element(self, element: Element, state: str):
+        if self.element_cache is None:
+            return None
+
+        web_element = self.element_cache.get(element, state)
+        if web_element is not None:
+            self.log.info_log(f"{self.host} Reuse cached element: <{element.name}>, state: {state}")
+        return web_element
+
+    def _cache_element(self, element: Element, web_element):
+        if self.element_cache is not None:
+            self.element_cache.put(element, web_element)
+
+    def _execute_async_script(self, script: str, timeout: float, *args):
+        # The script resolves itself after timeout, the driver's script timeout (30s by default)
+        # must not abort it earlier
+        previous_timeout = self.driver.timeouts.script
+        if previous_timeout >= timeout + 1:
+            return self.driver.execute_async_script(script, *args)
+
+        self.driver.set_script_timeout(timeout + 1)
+        try:
+            return self.driver.execute_async_script(script, *args)
+        finally:
+            self.driver.set_script_timeout(previous_timeout)
+
     @page_utils_exception(error_message_template="{self.host} Navigate to URL failed")
-    def goto_url(self, url: str, is_wait_for_load: bool = False):
+    def goto_url(self, url: str, is_wait_for_load: bool = False, is_wait_for_network_idle: bool = False):
         start_time = datetime.now()
 
         with allure.step(f"Navigate to {url}"):
+            if is_wait_for_network_idle:
+                self.install_network_tracker()
+
             self.driver.get(url)
 
             if is_wait_for_load:
                 self.wait_for_fully_loaded()
 
+            if is_wait_for_network_idle:
+                self.wait_for_network_idle()
+
             self._log_duration(start_time, f"Navigate to {url}")
 
     @page_utils_exception(error_message_template="{self.host} Get current URL failed")
@@ -97,8 +171,49 @@ class PageUtils:
         wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
         self.log.info_log(f"{self.host} Page fully loaded")
 
+    @page_utils_exception(error_message_template="{self.host} Install network tracker failed")
+    def install_network_tracker(self):
+        # Through CDP the tracker also sees requests sent before the first script runs on new documents.
+        # The identifier is kept on the driver so DriverPool removes the script before the next test
+        new_document_scripts = getattr(self.driver, "_new_document_scripts", None)
+        if new_document_scripts is None:
+            new_document_scripts = self.driver._new_document_scripts = {}
+
+        if "network_tracker" not in new_document_scripts and hasattr(self.driver, "execute_cdp_cmd"):
+            result = self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": NETWORK_TRACKER_JS})
+            new_document_scripts["network_tracker"] = result["identifier"]
+
+        self.driver.execute_script(NETWORK_TRACKER_JS)
+
+    @page_utils_exception(error_message_template="{self.host} Wait for network idle timeout")
+    def wait_for_network_idle(self, max_inflight: int = 0, idle_ms: int = 500, timeout: int = None) -> dict:
+        start_time = datetime.now()
+        wait_time = timeout if timeout else self.element_wait_time
+        self.install_network_tracker()
+
+        is_idle = self._execute_async_script(WAIT_FOR_NETWORK_IDLE_JS, wait_time, max_inflight, idle_ms, wait_time * 1000)
+        if not is_idle:
+            raise TimeoutException(f"{self.host} More than {max_inflight} request(s) in flight within {idle_ms}ms")
+
+        self._log_duration(start_time, f"Wait for network idle (<= {max_inflight} in flight for {idle_ms}ms)")
+        return self.get_page_timing()
+
+    @page_utils_exception(error_message_template="{self.host} Get page timing failed")
+    def get_page_timing(self) -> dict:
+        timing = self.driver.execute_script(PAGE_TIMING_JS)
+        navigation = timing["navigation"]
+        self.log.info_log(
+            f"{self.host} Page timing: TTFB {navigation.get('ttfb')}ms, DOMContentLoaded {navigation.get('dom_content_loaded')}ms, "
+            f"load {navigation.get('load_event_end')}ms, LCP {timing['largest_contentful_paint']}ms"
+        )
+        return timing
+
     @page_utils_exception(error_message_template="{self.host} Element not found: {element}")
     def find_element_visible(self, element: Element, timeout: int = None):
+        web_element = self._get_cached_element(element, "visible")
+        if web_element is not None:
+            return web_element
+
         start_time = datetime.now()
         wait = self._get_wait(timeout)
 
@@ -107,6 +222,7 @@ class PageUtils:
             message=f"{self.host} Element not found: {element}"
         )
         self._log_duration(start_time, "Find element", element.name)
+        self._cache_element(element, web_element)
         return web_element
 
     @page_utils_exception(error_message_template="{self.host} Elements not found: {element}")
@@ -125,8 +241,38 @@ class PageUtils:
         self.log.info_log(f"{self.host} Find all elements: <{element.name}>, count: {len(web_elements)}, duration: {formatted_duration}s")
         return web_elements
 
+    @page_utils_exception(error_message_template="{self.host} Nth element not found: {element}")
+    def find_nth_element(self, element: Element, index: int, timeout: int = None):
+        if index < 1:
+            raise ValueError(f"Index starts from 1, got {index}")
+
+        start_time = datetime.now()
+        last_count = [0]
+
+        # Resolve only the target match, one script call per poll
+        def nth_visible(driver):
+            count, web_element, is_visible = driver.execute_script(FIND_NTH_ELEMENT_JS, element.by, element.selector, index)
+            last_count[0] = count
+            return web_element if is_visible else False
+
+        try:
+            web_element = self._get_wait(timeout).until(nth_visible)
+        except TimeoutException:
+            if last_count[0] < index:
+                error_message = f"{self.host} Element #{index} out of range, total {last_count[0]} found: {element}"
+                self.log.error_log(error_message)
+                raise CustomException(error_message)
+            raise
+
+        self._log_duration(start_time, f"Find element #{index} of {last_count[0]}", element.name)
+        return web_element
+
     @page_utils_exception(error_message_template="{self.host} Clickable element not found: {element}")
     def find_clickable_element(self, element: Element, timeout: int = None):
+        web_element = self._get_cached_element(element, "clickable")
+        if web_element is not None:
+            return web_element
+
         start_time = datetime.now()
         wait = self._get_wait(timeout)
 
@@ -135,10 +281,15 @@ class PageUtils:
             message=f"{self.host} Clickable element not found: {element}"
         )
         self._log_duration(start_time, "Find clickable element", element.name)
+        self._cache_element(element, web_element)
         return web_element
 
     @page_utils_exception(error_message_template="{self.host} Element not located: {element}")
     def find_element_located(self, element: Element, timeout: int = None):
+        web_element = self._get_cached_element(element, "located")
+        if web_element is not None:
+            return web_element
+
         start_time = datetime.now()
         wait = self._get_wait(timeout)
 
@@ -147,6 +298,7 @@ class PageUtils:
             message=f"{self.host} Element not located: {element}"
         )
         self._log_duration(start_time, "Locate element", element.name)
+        self._cache_element(element, web_element)
         return web_element
 
     @page_utils_exception(error_message_template="{self.host} Element not visible: {element}")
@@ -204,7 +356,13 @@ class PageUtils:
                     self.log.error_log(error_message)
                     raise CustomException(error_message)
 
-                time.sleep(delay)
+                # Give overlays and animations a chance to finish instead of a fixed sleep. The script
+                # cannot run while the page unloads or an alert is open, retrying must still go on then
+                try:
+                    self.wait_for_dom_quiet(timeout=delay)
+                except Exception as wait_error:
+                    self.log.debug_log(f"{self.host} Wait for DOM quiet failed, sleep {delay}s instead: {wait_error}")
+                    time.sleep(delay)
 
     @page_utils_exception(error_message_template="{self.host} Click element failed: {element}")
     def click_element(self, element: Element, is_wait_for_load: bool = False, timeout: int = None):
@@ -227,18 +385,37 @@ class PageUtils:
 
     @page_utils_exception(error_message_template="{self.host} Input to element failed: {element}")
     def input_value_to_element(self, element: Element, value: str, is_clear: bool = True,
-                              need_enter: bool = False, is_wait_for_load: bool = False, timeout: int = None):
-        self.log.info_log(f"{self.host} Input text: {value} to: {element.name}")
+                              need_enter: bool = False, is_wait_for_load: bool = False, timeout: int = None,
+                              fill_mode: str = "keys"):
+        valid_fill_modes = ["keys", "fast"]
+
+        if fill_mode not in valid_fill_modes:
+            raise ValueError(f"Invalid fill mode: {fill_mode}. Valid fill modes: {', '.join(valid_fill_modes)}")
+
+        self.log.info_log(f"{self.host} Input text: {value} to: {element.name}, mode: {fill_mode}")
 
         web_element = self.find_clickable_element(element, timeout)
         self.roll_to_element(web_element, element.name)
 
-        if is_clear:
-            self.log.info_log(f"{self.host} Clear element: {element.name}")
-            web_element.clear()
-            time.sleep(0.5)
+        is_filled = False
+        if fill_mode == "fast":
+            # Whole value in one script call, fires input/change events for React-controlled inputs
+            filled_value = self.driver.execute_script(FAST_FILL_JS, web_element, str(value), is_clear)
+            is_filled = filled_value is not None and (not is_clear or filled_value == str(value))
+
+            if not is_filled:
+                self.log.warning_log(f"{self.host} Fast fill <{element.name}> not applied, fall back to keystrokes")
+
+        if not is_filled:
+            if is_clear:
+                self.log.info_log(f"{self.host} Clear element: {element.name}")
+                web_element.clear()
+                self.wait_for_input_value(web_element, "", element.name)
 
-        web_element.send_keys(str(value))
+            web_element.send_keys(str(value))
+
+            if is_clear:
+                self.wait_for_input_value(web_element, str(value), element.name)
 
         if need_enter:
             web_element.send_keys(Keys.RETURN)
@@ -276,8 +453,7 @@ class PageUtils:
 
     @page_utils_exception(error_message_template="{self.host} Get all elements text failed: {element}")
     def get_all_elements_text(self, element: Element, is_clean: bool = False, timeout: int = None) -> list:
-        web_elements = self.find_elements_visible(element, timeout)
-        text_list = [elem.text for elem in web_elements]
+        text_list = self.extract_elements_data(element, timeout=timeout)["text"]
 
         if is_clean:
             text_list = [text.replace('\n', ' ').strip() for text in text_list]
@@ -285,13 +461,51 @@ class PageUtils:
         self.log.info_log(f"{self.host} Get all elements <{element.name}> text, count: {len(text_list)}")
         return text_list
 
+    @page_utils_exception(error_message_template="{self.host} Get all elements attribute failed: {element}")
+    def get_all_elements_attribute(self, element: Element, attribute: str, timeout: int = None) -> list:
+        values = self.extract_elements_data(element, include_text=False, attributes=[attribute], timeout=timeout)[attribute]
+        self.log.info_log(f"{self.host} Get all elements <{element.name}> attribute: {attribute}, count: {len(values)}")
+        return values
+
+    @page_utils_exception(error_message_template="{self.host} Get all elements rect failed: {element}")
+    def get_all_elements_rect(self, element: Element, timeout: int = None) -> list:
+        rects = self.extract_elements_data(element, include_text=False, include_rect=True, timeout=timeout)["rect"]
+        self.log.info_log(f"{self.host} Get all elements <{element.name}> rect, count: {len(rects)}")
+        return rects
+
     @page_utils_exception(error_message_template="{self.host} Get elements count failed: {element}")
     def get_elements_count(self, element: Element, timeout: int = None) -> int:
-        web_elements = self.find_elements_visible(element, timeout)
-        count = len(web_elements)
+        count = len(self.extract_elements_data(element, include_text=False, as_rows=True, timeout=timeout))
         self.log.info_log(f"{self.host} Get elements <{element.name}> count: {count}")
         return count
 
+    @page_utils_exception(error_message_template="{self.host} Extract elements data failed: {element}")
+    def extract_elements_data(self, element: Element, include_text: bool = True, attributes: list = None,
+                              include_rect: bool = False, columns: dict = None, as_rows: bool = False,
+                              visible_only: bool = True, timeout: int = None):
+        start_time = datetime.now()
+        attributes = attributes or []
+        columns = columns or {}
+
+        # Text, attributes and rects of every match in one execute_script call per poll,
+        # waits like find_elements_visible when visible_only is set
+        def extract(driver):
+            result = driver.execute_script(
+                EXTRACT_ELEMENTS_JS, element.by, element.selector, include_text, attributes,
+                include_rect, columns, visible_only
+            )
+            # Wrap so an empty list (no match, visible_only off) still ends the wait
+            return None if result is None else (result,)
+
+        rows, = self._get_wait(timeout).until(extract, message=f"{self.host} Elements not found: {element}")
+        self._log_duration(start_time, f"Extract {len(rows)} elements data", element.name)
+
+        if as_rows:
+            return rows
+
+        keys = (["text"] if include_text else []) + attributes + (["rect"] if include_rect else []) + list(columns)
+        return {key: [row[key] for row in rows] for key in keys}
+
     @page_utils_exception(error_message_template="{self.host} Get element attribute failed: {element}")
     def get_element_attribute_value(self, element: Element, attribute: str, timeout: int = None):
         web_element = self.find_element_visible(element, timeout)
@@ -343,6 +557,64 @@ class PageUtils:
             self.log.error_log(error_message)
             raise CustomException(error_message)
 
+    ELEMENTS_STATES = ["present", "visible", "invisible", "clickable", "enabled", "disabled"]
+
+    @page_utils_exception(error_message_template="{self.host} Check elements state failed")
+    def check_elements_state(self, elements: list, states="visible", timeout: int = None) -> list:
+        states = [states] * len(elements) if isinstance(states, str) else list(states)
+
+        if len(states) != len(elements):
+            raise ValueError(f"Got {len(states)} states for {len(elements)} elements")
+        for state in states:
+            if state not in self.ELEMENTS_STATES:
+                raise ValueError(f"Invalid state: {state}. Valid states: {', '.join(self.ELEMENTS_STATES)}")
+
+        start_time = datetime.now()
+        queries = [[element.by, element.selector, state] for element, state in zip(elements, states)]
+        results = []
+
+        # One execute_script per poll for all elements instead of one command per element
+        def all_matched(driver):
+            results[:] = driver.execute_script(QUERY_ELEMENTS_STATE_JS, queries)
+            return all(result["matched"] for result in results)
+
+        try:
+            self._get_wait(timeout).until(all_matched)
+        except TimeoutException:
+            pending = [element.name for element, result in zip(elements, results) if not result["matched"]]
+            self.log.info_log(f"{self.host} Elements state check failed: {pending}")
+
+        self._log_duration(start_time, f"Check {len(elements)} elements state")
+        # A list in input order, Element hashes on (by, selector) so duplicates would collapse in a dict
+        return [
+            {**result, "element": element, "state": state}
+            for element, state, result in zip(elements, states, results)
+        ]
+
+    @page_utils_exception(error_message_template="{self.host} Wait for any element timeout")
+    def wait_for_any(self, elements: list, state: str = "visible", timeout: int = None) -> Element:
+        if state not in self.ELEMENTS_STATES:
+            raise ValueError(f"Invalid state: {state}. Valid states: {', '.join(self.ELEMENTS_STATES)}")
+
+        start_time = datetime.now()
+        queries = [[element.by, element.selector, state] for element in elements]
+        names = ", ".join(element.name for element in elements)
+
+        # Poll all candidates in the same loop, the first one in the state wins
+        def first_matched(driver):
+            results = driver.execute_script(QUERY_ELEMENTS_STATE_JS, queries)
+            for element, result in zip(elements, results):
+                if result["matched"]:
+                    return element
+            return False
+
+        matched_element = self._get_wait(timeout).until(
+            first_matched,
+            message=f"{self.host} None of elements is {state}: {names}"
+        )
+        self._log_duration(start_time, f"Wait for any {state} element, matched", matched_element.name)
+        return matched_element
+
     @page_utils_exception(error_message_template="{self.host} Scroll to element failed")
     def roll_to_element(self, element, element_name: str = None, block_position: str = "center"):
         if isinstance(element, Element):
@@ -354,7 +626,7 @@ class PageUtils:
 
         self.log.info_log(f"{self.host} Scroll to element: <{name}>, position: {block_position}")
         self.driver.execute_script(f"arguments[0].scrollIntoView({{block: '{block_position}', behavior: 'smooth'}});", web_element)
-        time.sleep(0.5)
+        self.wait_for_scroll_end()
 
     @page_utils_exception(error_message_template="{self.host} Scroll page failed")
     def scroll_page(self, x: int = 0, y: int = 0, count: int = 1, wait_timeout: int = 2):
@@ -363,33 +635,100 @@ class PageUtils:
             self.log.info_log(f"{self.host} Scroll page ({x}, {y}) - {i+1}/{count}")
 
             if wait_timeout > 0:
-                time.sleep(wait_timeout)
+                # Wait for the scroll and any lazy-loaded content, both within one wait_timeout
+                deadline = time.monotonic() + wait_timeout
+                self.wait_for_scroll_end(timeout=wait_timeout)
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    self.wait_for_dom_quiet(timeout=remaining)
 
             # Check if reached bottom after waiting
             if i < count - 1:  # Only check if not last iteration
-                old_scroll_y = self.driver.execute_script("return window.pageYOffset")
-                self.driver.execute_script(f"window.scrollBy(0, 1)")  # Try scroll 1px
-                time.sleep(0.1)
-                new_scroll_y = self.driver.execute_script("return window.pageYOffset")
+                is_bottom = self.driver.execute_script(
+                    "return window.innerHeight + window.pageYOffset >= document.documentElement.scrollHeight - 1"
+                )
 
-                if new_scroll_y == old_scroll_y:
+                if is_bottom:
                     self.log.info_log(f"{self.host} Reached bottom, stop scrolling (Total {i+1})")
                     break
-                else:
-                    # Scroll back if not at bottom
-                    self.driver.execute_script(f"window.scrollBy(0, -1)")
+
+    @page_utils_exception(error_message_template="{self.host} Wait for scroll end failed")
+    def wait_for_scroll_end(self, idle_ms: int = 100, timeout: float = 2) -> bool:
+        start_time = datetime.now()
+
+        # Resolves once no scroll event (window or any container) fired for idle_ms
+        is_settled = self._execute_async_script("""
+            const [idleMs, timeoutMs, done] = arguments;
+            let lastScroll = performance.now();
+            const onScroll = () => { lastScroll = performance.now(); };
+            const finish = (settled) => {
+                clearInterval(timer);
+                clearTimeout(guard);
+                document.removeEventListener('scroll', onScroll, true);
+                done(settled);
+            };
+            document.addEventListener('scroll', onScroll, true);
+            const timer = setInterval(() => {
+                if (performance.now() - lastScroll >= idleMs) finish(true);
+            }, 16);
+            const guard = setTimeout(() => finish(false), timeoutMs);
+        """, timeout, idle_ms, timeout * 1000)
+
+        self._log_duration(start_time, f"Wait for scroll end (settled: {is_settled})")
+        return is_settled
+
+    @page_utils_exception(error_message_template="{self.host} Wait for DOM quiet failed")
+    def wait_for_dom_quiet(self, quiet_ms: int = 300, timeout: float = 2) -> bool:
+        start_time = datetime.now()
+
+        # Resolves once the DOM had no mutation for quiet_ms
+        is_quiet = self._execute_async_script("""
+            const [quietMs, timeoutMs, done] = arguments;
+            let lastMutation = performance.now();
+            const observer = new MutationObserver(() => { lastMutation = performance.now(); });
+            const finish = (quiet) => {
+                observer.disconnect();
+                clearInterval(timer);
+                clearTimeout(guard);
+                done(quiet);
+            };
+            observer.observe(document, { childList: true, subtree: true, attributes: true, characterData: true });
+            const timer = setInterval(() => {
+                if (performance.now() - lastMutation >= quietMs) finish(true);
+            }, 50);
+            const guard = setTimeout(() => finish(false), timeoutMs);
+        """, timeout, quiet_ms, timeout * 1000)
+
+        self._log_duration(start_time, f"Wait for DOM quiet (quiet: {is_quiet})")
+        return is_quiet
+
+    @page_utils_exception(error_message_template="{self.host} Wait for input value failed")
+    def wait_for_input_value(self, web_element, expected_value: str, element_name: str = None, timeout: int = 2) -> bool:
+        name = element_name or "element"
+
+        try:
+            self._get_wait(timeout).until(lambda driver: web_element.get_attribute("value") == expected_value)
+            return True
+
+        except TimeoutException:
+            # Inputs with masks or max length may legitimately hold a different value
+            self.log.warning_log(f"{self.host} Input <{name}> value not confirmed: {expected_value}")
+            return False
+
+    def actions(self) -> PageActions:
+        return PageActions(self)
 
     @page_utils_exception(error_message_template="{self.host} Move to element failed: {element}")
     def move_to_element(self, element: Element):
         self.log.info_log(f"{self.host} Move mouse to element: <{element.name}>")
         web_element = self.find_clickable_element(element)
-        self.action_chains.move_to_element(web_element).perform()
+        self.actions().hover(web_element).perform()
 
     @page_utils_exception(error_message_template="{self.host} Move to element and click failed: {element}")
     def move_to_element_and_click(self, element: Element):
         self.log.info_log(f"{self.host} Move to element and click: <{element.name}>")
         web_element = self.find_element_located(element)
-        self.action_chains.move_to_element(web_element).click().perform()
+        self.actions().hover(web_element).click().perform()
 
     @page_utils_exception(error_message_template="{self.host} Switch window failed")
     def switch_window(self, index: int = -1, is_wait_for_load: bool = True):
@@ -414,15 +753,39 @@ class PageUtils:
         self.driver.close()
 
     @page_utils_exception(error_message_template="{self.host} Wait for condition failed")
-    def wait_for_condition(self, condition_func, timeout: int = None, message: str = ""):
+    def wait_for_condition(self, condition_func, timeout: int = None, message: str = "",
+                           poll_scheduler: PollScheduler = None):
         start_time = datetime.now()
-        wait = self._get_wait(timeout)
+        wait = self._get_wait(timeout, poll_scheduler)
 
         result = wait.until(condition_func, message=message or f"{self.host} Custom condition not met")
 
         self._log_duration(start_time, "Wait for condition", message)
         return result
 
+    @page_utils_exception(error_message_template="{self.host} Wait for media playing timeout")
+    def wait_for_media_playing(self, selector: str = "video", timeout: int = None) -> dict:
+        start_time = datetime.now()
+        wait_time = timeout if timeout else self.element_wait_time
+
+        # Resolves on the media 'playing' / 'timeupdate' events instead of polling currentTime
+        report = self._execute_async_script(WAIT_FOR_MEDIA_PLAYING_JS, wait_time, selector, wait_time * 1000)
+        if not report["playing"]:
+            state = f"readyState: {report.get('ready_state')}" if report["found"] else "not found"
+            raise TimeoutException(f"{self.host} Media <{selector}> not playing, {state}")
+
+        self._log_duration(start_time, f"Wait for media playing, time to first frame: {report['time_to_first_frame_ms']}ms", selector)
+        return report
+
+    @page_utils_exception(error_message_template="{self.host} Get media playback stats failed")
+    def get_media_playback_stats(self, selector: str = "video") -> dict:
+        report = self.driver.execute_script(MEDIA_PLAYBACK_STATS_JS, selector)
+        self.log.info_log(
+            f"{self.host} Media <{selector}> playback: dropped frames {report.get('dropped_frames')}/{report.get('total_frames')}, "
+            f"waiting {report.get('waiting_count')}, stalled {report.get('stalled_count')}"
+        )
+        return report
+
     @page_utils_exception(error_message_template="{self.host} Screenshot failed")
     def page_screenshot(self, save_path: str, full_page: bool = False):
         if full_page:
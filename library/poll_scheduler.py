@@ -0,0 +1,140 @@
+import json, os, time
+from abc import ABC, abstractmethod
+from collections import Counter
+from threading import Lock
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+class PollScheduler(ABC):
+    @abstractmethod
+    def intervals(self):
+        pass
+
+
+class FixedPollScheduler(PollScheduler):
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+
+    def intervals(self):
+        while True:
+            yield self.interval
+
+    def __repr__(self):
+        return f"FixedPollScheduler(interval={self.interval})"
+
+
+class BackoffPollScheduler(PollScheduler):
+    # Poll fast right after the wait starts, then back off exponentially up to max_interval
+    def __init__(self, initial: float = 0.05, factor: float = 2.0, max_interval: float = 0.5, fast_polls: int = 3):
+        self.initial = initial
+        self.factor = factor
+        self.max_interval = max_interval
+        self.fast_polls = fast_polls
+
+    def intervals(self):
+        for _ in range(self.fast_polls):
+            yield self.initial
+
+        interval = self.initial
+        while True:
+            interval = min(interval * self.factor, self.max_interval)
+            yield interval
+
+    def __repr__(self):
+        return (f"BackoffPollScheduler(initial={self.initial}, factor={self.factor}, "
+                f"max_interval={self.max_interval}, fast_polls={self.fast_polls})")
+
+
+class PollStatsRecorder:
+    _instance = None
+    _lock = Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance.stats = {}
+        return cls._instance
+
+    def record(self, label: str, polls: int, duration: float, is_timeout: bool):
+        with self._lock:
+            stat = self.stats.setdefault(label, {
+                "waits": 0, "timeouts": 0, "polls": 0, "max_polls": 0,
+                "total_seconds": 0.0, "polls_histogram": Counter()
+            })
+            stat["waits"] += 1
+            stat["timeouts"] += int(is_timeout)
+            stat["polls"] += polls
+            stat["max_polls"] = max(stat["max_polls"], polls)
+            stat["total_seconds"] += duration
+            stat["polls_histogram"][polls] += 1
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {
+                label: {
+                    **{key: value for key, value in stat.items() if key != "polls_histogram"},
+                    "avg_polls": round(stat["polls"] / stat["waits"], 2),
+                    "total_seconds": round(stat["total_seconds"], 3),
+                    "polls_histogram": {str(polls): count for polls, count in sorted(stat["polls_histogram"].items())},
+                }
+                for label, stat in self.stats.items()
+            }
+
+    def export_json(self, file_path: str):
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, indent=4)
+
+
+class AdaptiveWebDriverWait(WebDriverWait):
+    def __init__(self, driver, timeout: float, poll_scheduler: PollScheduler, label: str = "wait",
+                 ignored_exceptions=None):
+        super().__init__(driver, timeout, ignored_exceptions=ignored_exceptions)
+        self.poll_scheduler = poll_scheduler
+        self.label = label
+        self.recorder = PollStatsRecorder()
+
+    def until(self, method, message: str = ""):
+        return self._poll_until(method, message, until_not=False)
+
+    def until_not(self, method, message: str = ""):
+        return self._poll_until(method, message, until_not=True)
+
+    def _poll_until(self, method, message: str, until_not: bool):
+        screen = None
+        stacktrace = None
+        polls = 0
+        start_time = time.monotonic()
+        end_time = start_time + self._timeout
+        intervals = self.poll_scheduler.intervals()
+
+        try:
+            while True:
+                polls += 1
+                try:
+                    value = method(self._driver)
+                    if bool(value) != until_not:
+                        self.recorder.record(self.label, polls, time.monotonic() - start_time, False)
+                        return value
+
+                except self._ignored_exceptions as exc:
+                    if until_not:
+                        self.recorder.record(self.label, polls, time.monotonic() - start_time, False)
+                        return True
+                    screen = getattr(exc, "screen", None)
+                    stacktrace = getattr(exc, "stacktrace", None)
+
+                remaining = end_time - time.monotonic()
+                if remaining <= 0:
+                    break
+                time.sleep(min(next(intervals), remaining))
+
+        except BaseException:
+            # Errors raised by the condition itself still count as a finished wait
+            self.recorder.record(self.label, polls, time.monotonic() - start_time, False)
+            raise
+
+        self.recorder.record(self.label, polls, time.monotonic() - start_time, True)
+        raise TimeoutException(message, screen, stacktrace)
@@ -0,0 +1,175 @@
+import time
+from collections import deque
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from library.logger import HandleLog
+from library.poll_scheduler import BackoffPollScheduler
+
+
+class TabWait:
+    def __init__(self, tab, condition, description: str, ignored_exceptions: tuple = None):
+        self.tab = tab
+        self.condition = condition
+        self.description = description
+        # None falls back to the pool's ignored_exceptions
+        self.ignored_exceptions = ignored_exceptions
+        self.last_error = None
+
+
+class Tab:
+    def __init__(self, pool, index: int, handle: str, pages=None):
+        self.pool = pool
+        self.index = index
+        self.handle = handle
+        self.pages = pages
+
+    def open(self, url: str) -> TabWait:
+        # Start the navigation without blocking, the pool polls the returned wait
+        self.pool.activate(self)
+        self.pool.driver.execute_script("window.__tabNavigating = true; window.location.href = arguments[0];", url)
+        return self.until(
+            lambda driver: driver.execute_script("return !window.__tabNavigating && document.readyState === 'complete'"),
+            f"load {url}"
+        )
+
+    def until(self, condition, description: str = "condition", ignored_exceptions: tuple = None) -> TabWait:
+        return TabWait(self, condition, description, ignored_exceptions)
+
+
+class TabResult:
+    def __init__(self, item, tab_index: int, value=None, error: Exception = None, duration: float = 0.0):
+        self.item = item
+        self.tab_index = tab_index
+        self.value = value
+        self.error = error
+        self.duration = duration
+
+    @property
+    def is_success(self) -> bool:
+        return self.error is None
+
+    def __repr__(self):
+        status = "ok" if self.is_success else f"error: {self.error}"
+        return f"TabResult(item={self.item!r}, tab={self.tab_index}, {status}, {self.duration:.2f}s)"
+
+
+class TabPool:
+    # Runs one generator-based flow per tab in a single driver. A flow yields TabWait
+    # objects (tab.open / tab.until) and the pool polls all pending waits round-robin,
+    # so page loads in different tabs overlap instead of running one after another.
+    def __init__(self, driver: webdriver.Remote, size: int, page_factory=None, timeout: int = 30,
+                 ignored_exceptions: tuple = (NoSuchElementException,)):
+        self.host = '[TabPool]'
+        self.driver = driver
+        self.timeout = timeout
+        # Like WebDriverWait: these mean "not yet" while polling, any other error fails the flow
+        self.ignored_exceptions = tuple(ignored_exceptions)
+        self.log = HandleLog()
+        self.poll_scheduler = BackoffPollScheduler()
+        self._active_handle = driver.current_window_handle
+
+        handles = [self._active_handle]
+        for _ in range(size - 1):
+            self.driver.switch_to.new_window('tab')
+            handles.append(self.driver.current_window_handle)
+        self.driver.switch_to.window(handles[0])
+
+        self.tabs = [
+            Tab(self, index, handle, page_factory(driver) if page_factory else None)
+            for index, handle in enumerate(handles)
+        ]
+        self.log.info_log(f"{self.host} Open {size} tab(s)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def activate(self, tab: Tab):
+        # switch_to.window costs a WebDriver command, skip it when already there
+        if self._active_handle != tab.handle:
+            self.driver.switch_to.window(tab.handle)
+            self._active_handle = tab.handle
+
+    def run(self, flow, items: list) -> list:
+        pending_items = deque(enumerate(items))
+        results = [None] * len(items)
+        running = {}
+        waits = {}
+
+        def start_next(tab: Tab):
+            if pending_items:
+                position, item = pending_items.popleft()
+                running[tab.index] = (position, item, flow(tab, item), time.monotonic())
+                advance(tab, None)
+
+        def advance(tab: Tab, value, error: Exception = None):
+            position, item, generator, start_time = running[tab.index]
+            self.activate(tab)
+            try:
+                wait = generator.throw(error) if error else generator.send(value)
+                waits[tab.index] = (wait, time.monotonic() + self.timeout)
+                return
+
+            except StopIteration as stop:
+                results[position] = TabResult(item, tab.index, value=stop.value, duration=time.monotonic() - start_time)
+            except Exception as e:
+                self.log.error_log(f"{self.host} Tab #{tab.index} flow for {item!r} failed: {e}")
+                results[position] = TabResult(item, tab.index, error=e, duration=time.monotonic() - start_time)
+
+            del running[tab.index]
+            waits.pop(tab.index, None)
+            start_next(tab)
+
+        for tab in self.tabs:
+            start_next(tab)
+
+        intervals = self.poll_scheduler.intervals()
+        while waits:
+            is_progressed = False
+
+            for tab_index, (wait, deadline) in list(waits.items()):
+                self.activate(wait.tab)
+                ignored_exceptions = self.ignored_exceptions if wait.ignored_exceptions is None else tuple(wait.ignored_exceptions)
+                try:
+                    value = wait.condition(self.driver)
+                except ignored_exceptions as e:
+                    value = None
+                    wait.last_error = e
+                except Exception as e:
+                    advance(wait.tab, None, e)
+                    is_progressed = True
+                    continue
+
+                if value:
+                    advance(wait.tab, value)
+                    is_progressed = True
+                elif time.monotonic() > deadline:
+                    message = f"{self.host} Tab #{tab_index} wait for {wait.description} timeout"
+                    if wait.last_error is not None:
+                        message += f", last error: {type(wait.last_error).__name__}"
+                    timeout_error = TimeoutException(message)
+                    timeout_error.__cause__ = wait.last_error
+                    advance(wait.tab, None, timeout_error)
+                    is_progressed = True
+
+            if is_progressed:
+                intervals = self.poll_scheduler.intervals()
+            elif waits:
+                time.sleep(next(intervals))
+
+        failed = sum(1 for result in results if not result.is_success)
+        self.log.info_log(f"{self.host} Run {len(items)} flow(s) in {len(self.tabs)} tab(s), failed: {failed}")
+        return results
+
+    def close(self):
+        for tab in self.tabs[1:]:
+            try:
+                self.driver.switch_to.window(tab.handle)
+                self.driver.close()
+            except Exception as e:
+                self.log.debug_log(f"{self.host} Close tab #{tab.index} failed: {e}")
+
+        self.driver.switch_to.window(self.tabs[0].handle)
+        self._active_handle = self.tabs[0].handle
@@ -0,0 +1,86 @@
+import json, os, threading
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+from threading import Lock
+
+
+class Tracer:
+    _instance = None
+    _lock = Lock()
+    _disabled_span = nullcontext()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.enabled = False
+        self.process_name = os.getenv("PYTEST_XDIST_WORKER", "main")
+        self.test_events = []
+        self.session_events = []
+        self._thread_names = {}
+
+    def start_test(self):
+        self.enabled = True
+        self.test_events = []
+
+    def stop_test(self) -> list:
+        # Stop recording until the next start_test, spans in between would leak into that test
+        self.enabled = False
+        events, self.test_events = self.test_events, []
+        self.session_events.extend(events)
+        return events
+
+    def span(self, name: str, category: str = "action", args: dict = None):
+        if not self.enabled:
+            return self._disabled_span
+        return self._span(name, category, args)
+
+    @contextmanager
+    def _span(self, name: str, category: str, args: dict):
+        start_time = perf_counter()
+        span_args = dict(args or {})
+        try:
+            yield span_args
+        except BaseException as e:
+            span_args["error"] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self.add_complete_event(name, category, start_time, perf_counter() - start_time, span_args)
+
+    def add_complete_event(self, name: str, category: str, start_time: float, duration: float, args: dict = None):
+        if not self.enabled:
+            return
+
+        thread = threading.current_thread()
+        self._thread_names.setdefault(thread.ident, thread.name)
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round(start_time * 1_000_000, 3),
+            "dur": round(duration * 1_000_000, 3),
+            "pid": os.getpid(),
+            "tid": thread.ident,
+        }
+        if args:
+            event["args"] = {key: str(value) for key, value in args.items()}
+
+        with self._lock:
+            self.test_events.append(event)
+
+    def export_json(self, events: list, file_path: str):
+        # Chrome trace-event format, loads in chrome://tracing and Perfetto
+        metadata = [{"name": "process_name", "ph": "M", "pid": os.getpid(), "args": {"name": self.process_name}}]
+        metadata += [
+            {"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": ident, "args": {"name": name}}
+            for ident, name in self._thread_names.items()
+        ]
+
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, f)
+
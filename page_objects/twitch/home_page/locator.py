@@ -1,10 +1,11 @@
-from library.element import Element
+from library.element import Element, LocatorRegistry, locator
 from selenium.webdriver.common.by import By
 
-class HomePageLocator:
+class HomePageLocator(LocatorRegistry):
     def __init__(self, driver):
         self.driver = driver
 
+    @locator
     def footer_browse_link(self) -> Element:
         return Element(
             name="Footer - Browse Link",
@@ -1,5 +1,5 @@
 import allure
-import time
+import json
 from library.page_utils import PageUtils
 from library.allure import allure_attach_log
 from page_objects.twitch.search_page.locator import SearchPageLocator
@@ -8,7 +8,7 @@ from library.exception import CustomException
 
 class SearchPageAction(PageUtils, SearchPageLocator):
     def __init__(self, driver):
-        PageUtils.__init__(self, driver)
+        PageUtils.__init__(self, driver, use_element_cache=True)
         SearchPageLocator.__init__(self, driver)
         self.validator = Validator()
     
@@ -18,7 +18,7 @@ class SearchPageAction(PageUtils, SearchPageLocator):
             self.click_element(self.search_input())
 
         with allure.step(f"Input search text: {stream_name}"):
-            self.input_value_to_element(self.search_input(), stream_name, is_wait_for_load=True)
+            self.input_value_to_element(self.search_input(), stream_name, is_wait_for_load=True, fill_mode="fast")
 
         with allure.step("Press Enter key"):
             self.send_key_to_element(self.search_input(), "Enter", is_wait_for_load=True)
@@ -33,30 +33,21 @@ class SearchPageAction(PageUtils, SearchPageLocator):
 
     @allure_attach_log(log_name="Check Search Result")
     def check_search_result(self):
-        with allure.step("Check search result warning text"):
-            result = self.check_element_state(self.search_result_warning_text(), "visible", timeout=3)
+        with allure.step("Wait for search result or warning text"):
+            result_element = self.wait_for_any([self.stream_list(), self.search_result_warning_text()], "visible")
 
-        if result:
+        if result_element == self.search_result_warning_text():
             raise CustomException("No streams found")
 
     @allure_attach_log(log_name="Select Stream by Index")
     def select_stream_by_index(self, index: int):
-        with allure.step("Get stream list count"):
-            stream_count = self.get_elements_count(self.stream_list())
-
-        if index > stream_count:
-            raise CustomException(f"Stream #{index} does not exist, total {stream_count} streams")
-
         with allure.step(f"Select stream #{index}"):
-            stream_elements = self.find_elements_visible(self.stream_list())
-
-            if index <= len(stream_elements):
-                target_element = stream_elements[index - 1]
+            # Raises with the total stream count when index is out of range
+            target_element = self.find_nth_element(element=self.stream_list(), index=index)
 
-                # Scroll to element and click
-                self.roll_to_element(target_element, f"Stream #{index}")
-                time.sleep(0.5)
-                target_element.click()
+            # Scroll to element and click, roll_to_element waits for the scroll to settle
+            self.roll_to_element(target_element, f"Stream #{index}")
+            target_element.click()
 
     @allure_attach_log(log_name="Handle Content Classification Gate")
     def handle_content_classification_gate(self):
@@ -69,17 +60,10 @@ class SearchPageAction(PageUtils, SearchPageLocator):
             self.wait_for_element_state(self.video_player(), "visible")
 
         with allure.step("Wait for video to start playing"):
-            result =self.wait_for_condition(
-                condition_func=lambda driver: driver.execute_script("""
-                    const video_player = document.querySelector('video');
-                    return video_player && video_player.currentTime > 0 && video_player.readyState >= 3;
-                """),
-                timeout=5,
-                message="Video player ready"
+            playback = self.wait_for_media_playing("video", timeout=5)
+
+            allure.attach(
+                json.dumps(playback, indent=4),
+                name="Video playback metrics",
+                attachment_type=allure.attachment_type.JSON
             )
-        
-            self.validator.assert_is_equal(
-                expected=True,
-                actual=result,
-                key="Video player ready"
-            )
\ No newline at end of file
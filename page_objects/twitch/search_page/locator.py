@@ -1,10 +1,11 @@
-from library.element import Element
+from library.element import Element, LocatorRegistry, locator
 from selenium.webdriver.common.by import By
 
-class SearchPageLocator:
+class SearchPageLocator(LocatorRegistry):
     def __init__(self, driver):
         self.driver = driver
 
+    @locator
     def search_input(self) -> Element:
         return Element(
             name="Search Input",
@@ -12,6 +13,7 @@ class SearchPageLocator:
             selector='//input[@type="search"]'
         )
 
+    @locator
     def page_main_content_wrapper(self) -> Element:
         return Element(
             name="Page Main Content Wrapper",
@@ -19,18 +21,19 @@ class SearchPageLocator:
             selector='//main[@id="page-main-content-wrapper"]'
         )
 
+    @locator
     def stream_list(self, index: int = None) -> Element:
-        name = "Stream List"
-        selector = '//h2[text()="Channels"]/ancestor::div/following-sibling::div//button'
-        if index:
-            name = f"Stream #{index}"
-
-        return Element(
-            name=name,
+        stream_list = Element(
+            name="Stream List",
             by=By.XPATH,
-            selector=selector
+            selector='//h2[text()="Channels"]/ancestor::div/following-sibling::div//button'
         )
 
+        if index:
+            return stream_list.nth(index)
+        return stream_list
+
+    @locator
     def search_result_warning_text(self) -> Element:
         return Element(
             name="Search Result Warning Text",
@@ -38,6 +41,7 @@ class SearchPageLocator:
             selector='//h2[text()="Please try a different keyword"]'
         )
 
+    @locator
     def video_player(self) -> Element:
         return Element(
             name="Video Player",
@@ -45,6 +49,7 @@ class SearchPageLocator:
             selector='//div[@data-a-target="video-player"]'
         )
 
+    @locator
     def content_classification_gate_overlay(self) -> Element:
         return Element(
             name="Content Classification Gate Overlay",
@@ -52,6 +57,7 @@ class SearchPageLocator:
             selector='//div[@data-a-target="content-classification-gate-overlay"]'
         )
 
+    @locator
     def content_classification_gate_button(self) -> Element:
         return Element(
             name="Content Classification Gate Button - Start Watching",
@@ -1,8 +1,8 @@
 import allure
 import pytest
-import requests
 from pathlib import Path
 from api_object.httpbin_org import HttpbinOrg
+from library.async_api_utils import AsyncAPIClient
 from library.validator import Validator
 from conftest import load_test_data
 
@@ -20,9 +20,8 @@ class TestHttpBinOrgPost:
         load_test_data(str(DATA_DIR / "verify_success")),
         ids=lambda x: x["test_id"]
     )
-    def test_verify_success(self, test_case):
-        session = requests.Session()
-        httpbin_org = HttpbinOrg(session)
+    def test_verify_success(self, test_case, http_session_pool):
+        httpbin_org = HttpbinOrg(http_session_pool.get(HttpbinOrg.base_url))
         response_data = httpbin_org.post(json=test_case["payload"])\
             .check_status_success()\
             .get_response_data("json")
@@ -39,9 +38,8 @@ class TestHttpBinOrgPost:
         load_test_data(str(DATA_DIR / "verify_error")),
         ids=lambda x: x["test_id"]
     )
-    def test_verify_error(self, test_case):
-        session = requests.Session()
-        httpbin_org = HttpbinOrg(session)
+    def test_verify_error(self, test_case, http_session_pool):
+        httpbin_org = HttpbinOrg(http_session_pool.get(HttpbinOrg.base_url))
 
         response_data = httpbin_org.post(json=test_case["payload"])\
             .check_status_success()\
@@ -50,4 +48,27 @@ class TestHttpBinOrgPost:
         self.validator.deep_diff_compare(
             actual_data=response_data,
             expected_data=test_case["expected_data"]
-        )
\ No newline at end of file
+        )
+
+    @allure.sub_suite("Response Verify Concurrent Test")
+    @pytest.mark.HttpBinOrg
+    @pytest.mark.asyncio
+    async def test_verify_success_concurrently(self, http_session_pool):
+        test_cases = load_test_data(str(self.DATA_DIR / "verify_success"))
+
+        async def verify_case(client, test_case):
+            httpbin_org = await client.post(json=test_case["payload"])
+            return httpbin_org.check_status_success().get_response_data("json")
+
+        session = http_session_pool.get(HttpbinOrg.base_url)
+        async with AsyncAPIClient(lambda: HttpbinOrg(session), max_concurrency=4) as client:
+            results = await client.run_cases(test_cases, verify_case)
+
+        for result in results:
+            with allure.step(f"Verify case {result.case_id}"):
+                if not result.is_success:
+                    raise result.error
+                self.validator.deep_diff_compare(
+                    actual_data=result.value,
+                    expected_data=result.case["expected_data"]
+                )
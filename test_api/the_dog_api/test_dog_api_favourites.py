@@ -1,6 +1,5 @@
 import allure
 import pytest
-import requests
 import os
 from pathlib import Path
 from api_object.the_dog_api import TheDogAPI
@@ -21,8 +20,8 @@ class TestDogAPIFavourites:
         load_test_data(str(DATA_DIR / "favourite_success")),
         ids=lambda x: x["test_id"]
     )
-    def test_favourite_success(self, test_case):
-        session = requests.Session()
+    def test_favourite_success(self, test_case, http_session_pool):
+        session = http_session_pool.get(TheDogAPI.base_url)
         dog_api = TheDogAPI(session, api_key=os.getenv('DOG_API_KEY'))
 
         with allure.step(f"Add favourite with valid data"):
@@ -50,8 +49,8 @@ class TestDogAPIFavourites:
         load_test_data(str(DATA_DIR / "favourite_error")),
         ids=lambda x: x["test_id"]
     )
-    def test_favourite_error(self, test_case):
-        session = requests.Session()
+    def test_favourite_error(self, test_case, http_session_pool):
+        session = http_session_pool.get(TheDogAPI.base_url)
 
         # Handle API key scenarios
         if test_case.get("use_api_key") == False:
@@ -1,6 +1,9 @@
-import allure, pytest
+import allure, asyncio, pytest
 from pathlib import Path
+from selenium.webdriver.support import expected_conditions as EC
 from library.page_utils import PageUtils
+from library.tab_pool import TabPool
+from library.validator import Validator
 from page_objects.twitch import TwitchPages
 from conftest import load_test_data
 
@@ -9,8 +12,10 @@ from conftest import load_test_data
 @allure.suite("Search Stream")
 class TestTwitchSearch():
     DATA_DIR = Path(__file__).parent / "case_data"
+    validator = Validator()
 
     @pytest.mark.twitch
+    @pytest.mark.block_resources(types=["image", "font", "ads", "telemetry"])
     @allure.sub_suite("Search Stream Success Test")
     @allure.title("Twitch search stream and select streamer by index")
     def test_twitch_search(self, driver):
@@ -43,3 +48,59 @@ class TestTwitchSearch():
                 name="Screenshot", 
                 attachment_type=allure.attachment_type.PNG
             )
+
+    @pytest.mark.twitch
+    # Blocked URLs are set on the first tab only, tabs opened by TabPool would load unfiltered
+    @pytest.mark.block_resources(types=[], patterns=[])
+    @allure.sub_suite("Search Stream Success Test")
+    @allure.title("Twitch search several keywords in parallel tabs")
+    def test_twitch_search_keywords_in_tabs(self, driver):
+        test_data = load_test_data(str(self.DATA_DIR / "twitch_search"))
+        keywords = test_data["search_keywords"]
+
+        def search_flow(tab, keyword):
+            # Yielded waits are polled by the pool, other tabs keep loading meanwhile
+            yield tab.open(test_data["url"])
+
+            tab.pages.home.click_footer_browse_link()
+            main_content = tab.pages.search.page_main_content_wrapper()
+            yield tab.until(EC.visibility_of_element_located(main_content.locator), main_content.name)
+
+            tab.pages.search.search_stream(keyword)
+            tab.pages.search.check_search_result()
+            return tab.pages.search.get_elements_count(tab.pages.search.stream_list())
+
+        with TabPool(driver, size=len(keywords), page_factory=TwitchPages) as tab_pool:
+            results = tab_pool.run(search_flow, keywords)
+
+        for result in results:
+            with allure.step(f"Verify search result: {result.item}"):
+                self.validator.assert_is_equal(actual=result.error, expected=None, key=result.item)
+                self.validator.assert_greater(actual=result.value, expected=0, key=result.item)
+
+    @pytest.mark.twitch
+    @pytest.mark.asyncio
+    @pytest.mark.async_sessions(3)
+    @allure.sub_suite("Search Stream Success Test")
+    @allure.title("Twitch search several keywords in parallel browser sessions")
+    async def test_twitch_search_keywords_async(self, async_browsers):
+        test_data = load_test_data(str(self.DATA_DIR / "twitch_search"))
+
+        async def search_flow(session, keyword):
+            twitch = await session.page(TwitchPages)
+
+            await session.page_utils.goto_url(test_data["url"])
+            await twitch.home.click_footer_browse_link()
+            await twitch.search.wait_for_main_content_appear()
+            await twitch.search.search_stream(keyword)
+            await twitch.search.check_search_result()
+            return await twitch.search.get_elements_count(twitch.search.stream_list())
+
+        keywords = test_data["search_keywords"]
+        counts = await asyncio.gather(*(
+            search_flow(session, keyword) for session, keyword in zip(async_browsers, keywords)
+        ))
+
+        for keyword, count in zip(keywords, counts):
+            with allure.step(f"Verify search result: {keyword}"):
+                self.validator.assert_greater(actual=count, expected=0, key=keyword)